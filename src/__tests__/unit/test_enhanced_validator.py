@@ -223,4 +223,27 @@ def test_validation_rule_customization(validator):
     errors = validator.validate({"name": "Jo"})
     assert "name" in errors
 
+def test_subclass_validate_override(validator):
+    """Test that a subclass overriding validate() is not bypassed by the parent's compiled check."""
+    class AlwaysFailingRange(RangeRule):
+        __slots__ = ()
+        
+        def validate(self, data: Dict[str, Any]) -> str:
+            return self.message
+    
+    validator.add_rule("age", AlwaysFailingRange("age", 0, 150, "Age rejected"))
+    
+    errors = validator.validate({"age": 30})
+    assert errors["age"] == ["Age rejected"]
+
+def test_rules_are_read_only(validator):
+    """Test that rules can only change through add_rule, which keeps compiled checks current."""
+    validator.validate({"age": 200})
+    
+    with pytest.raises(TypeError):
+        validator.rules["age"] = [RangeRule("age", 0, 150, "Invalid age")]
+    
+    validator.add_rule("age", RangeRule("age", 0, 150, "Invalid age"))
+    assert validator.validate({"age": 200})["age"] == ["Invalid age"]
+
 # Add more test cases as needed 
\ No newline at end of file
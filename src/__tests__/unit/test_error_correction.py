@@ -0,0 +1,119 @@
+"""Tests for the automated error correction module."""
+
+import logging
+import joblib
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+from sklearn.ensemble import IsolationForest
+from .. import error_correction
+from ..error_correction import AutomatedErrorCorrector, CorrectionResult, _zscore_clip
+
+@pytest.fixture
+def corrector(tmp_path):
+    """Create a corrector with stubbed pretrained models and no shipped artifacts."""
+    config = {
+        'isolation_forest_path': str(tmp_path / 'isolation_forest.joblib'),
+        'preprocessing_stats_path': str(tmp_path / 'preprocessing.npz')
+    }
+    with patch.object(error_correction, '_get_tokenizer', return_value=MagicMock()), \
+         patch.object(error_correction, '_get_sequence_classifier', return_value=MagicMock()), \
+         patch.object(AutomatedErrorCorrector, '_prepare_model', side_effect=lambda model: model):
+        instance = AutomatedErrorCorrector(config)
+    yield instance
+    instance.close()
+
+@pytest.fixture
+def sample_values():
+    """Create a small numerical batch for the outlier detector."""
+    return np.random.default_rng(0).normal(size=(64, 3))
+
+def test_cache_hit_returns_independent_copies(corrector):
+    """Mutating a returned result must not change later answers for the same input."""
+    result = CorrectionResult(
+        original_data={'value': 1},
+        errors={'numerical_errors': []},
+        corrections={'numerical': {}},
+        confidence=0.5
+    )
+    with patch.object(corrector, '_run_correction', return_value=result) as run:
+        first = corrector.correct_errors({'value': 1})
+        first.errors['numerical_errors'].append('mutated')
+        first.corrections['numerical']['x'] = 'mutated'
+        second = corrector.correct_errors({'value': 1})
+
+    assert run.call_count == 1
+    assert second.errors == {'numerical_errors': []}
+    assert second.corrections == {'numerical': {}}
+    assert second is not first
+
+    third = corrector.correct_errors({'value': 1})
+    assert third is not second
+    assert third.errors is not second.errors
+
+def test_isolation_forest_fitted_when_artifact_missing(corrector, sample_values, caplog):
+    """Without the pre-fit model the corrector fits its own and warns once."""
+    with caplog.at_level(logging.WARNING, logger=error_correction.__name__):
+        forest = corrector._get_isolation_forest(sample_values)
+        again = corrector._get_isolation_forest(sample_values)
+
+    assert isinstance(forest, IsolationForest)
+    assert forest.predict(sample_values).shape == (64,)
+    assert again is forest
+    assert sum('IsolationForest not found' in record.message for record in caplog.records) == 1
+
+def test_isolation_forest_loaded_when_artifact_present(corrector, sample_values, caplog):
+    """A shipped pre-fit model is loaded instead of fitting a new one."""
+    joblib.dump(IsolationForest(contamination=0.1).fit(sample_values), corrector._iforest_path)
+    error_correction._shared_iforest.cache_clear()
+    try:
+        with caplog.at_level(logging.WARNING, logger=error_correction.__name__):
+            forest = corrector._get_isolation_forest(sample_values)
+    finally:
+        error_correction._shared_iforest.cache_clear()
+
+    assert isinstance(forest, IsolationForest)
+    assert not caplog.records
+
+def test_scaler_statistics_fitted_without_offline_stats(corrector):
+    """Numerical data is standardized with statistics fitted on its first batch."""
+    values = np.array([[1.0, 10.0], [3.0, 30.0]], dtype=np.float32)
+    scaled = corrector._preprocess_numerical(values).cpu().numpy()
+
+    np.testing.assert_allclose(scaled, [[-1.0, -1.0], [1.0, 1.0]], rtol=1e-6)
+
+def test_zscore_clip_rejects_mismatched_statistics():
+    """Statistics for a different feature width raise instead of reading out of bounds."""
+    values = np.ones((2, 3), dtype=np.float32)
+    mean = np.zeros(2, dtype=np.float32)
+    inv_std = np.ones(2, dtype=np.float32)
+
+    with pytest.raises(ValueError, match='features'):
+        _zscore_clip(values, mean, inv_std, -5.0, 5.0)
+
+def test_zscore_clip_clips_to_bounds():
+    """Standardized values are clipped to [lo, hi]."""
+    values = np.array([[0.0], [100.0]], dtype=np.float32)
+    mean = np.zeros(1, dtype=np.float32)
+    inv_std = np.ones(1, dtype=np.float32)
+
+    np.testing.assert_array_equal(_zscore_clip(values, mean, inv_std, -5.0, 5.0), [[0.0], [5.0]])
+
+def test_sequence_classifiers_keyed_by_role():
+    """Roles sharing a checkpoint get separate modules; each role is loaded once."""
+    error_correction._get_sequence_classifier.cache_clear()
+    try:
+        with patch.object(
+            error_correction.AutoModelForSequenceClassification,
+            'from_pretrained',
+            side_effect=lambda *args, **kwargs: MagicMock()
+        ) as from_pretrained:
+            detection = error_correction._get_sequence_classifier('detection', 'bert-base-uncased', 2)
+            validation = error_correction._get_sequence_classifier('validation', 'bert-base-uncased', 2)
+            detection_again = error_correction._get_sequence_classifier('detection', 'bert-base-uncased', 2)
+    finally:
+        error_correction._get_sequence_classifier.cache_clear()
+
+    assert detection is not validation
+    assert detection_again is detection
+    assert from_pretrained.call_count == 2
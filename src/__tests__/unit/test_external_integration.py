@@ -0,0 +1,133 @@
+"""Tests for the external ML services fan-out module."""
+
+import asyncio
+import aiohttp
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from ..external_integration import (
+    EMBEDDING_BATCH_SIZE,
+    ExternalMLIntegrator,
+    ServiceSpec,
+    _SERVICE_ENDPOINTS
+)
+
+@pytest.fixture
+def integrator():
+    """Create integrator instance with no response cache for testing."""
+    instance = ExternalMLIntegrator({})
+    instance._get_session = AsyncMock(return_value=MagicMock())
+    return instance
+
+@pytest.fixture
+def services():
+    """Create the OpenAI and HuggingFace service selections."""
+    return (
+        ServiceSpec(name='openai', config=_SERVICE_ENDPOINTS['openai'], priority=1.0),
+        ServiceSpec(name='huggingface', config=_SERVICE_ENDPOINTS['huggingface'], priority=0.5)
+    )
+
+def _result(service, status):
+    """Merged service result as returned by _process_single_service."""
+    return {
+        'service': service,
+        'response': {},
+        'metadata': {'timestamp': '', 'status': status, 'latency': None}
+    }
+
+def _http_error(status):
+    """Error raised by raise_for_status for an HTTP error status."""
+    return aiohttp.ClientResponseError(request_info=MagicMock(), history=(), status=status)
+
+@pytest.mark.asyncio
+async def test_breaker_counts_http_errors_and_timeouts(integrator, services):
+    """Error statuses and timeouts count against the breaker; successes reset it."""
+    outcomes = {'openai': _http_error(503), 'huggingface': asyncio.TimeoutError()}
+
+    async def call_service(session, service, request, context, timeout):
+        raise outcomes[service.name]
+
+    with patch.object(integrator, '_call_service', side_effect=call_service):
+        results = await integrator._process_with_services(MagicMock(), services, None)
+
+    assert results == []
+    assert integrator._breaker['openai']['fails'] == 1
+    assert integrator._breaker['huggingface']['fails'] == 1
+
+    async def succeed(session, service, request, context, timeout):
+        return _result(service.name, 200)
+
+    with patch.object(integrator, '_call_service', side_effect=succeed):
+        results = await integrator._process_with_services(MagicMock(), services, None)
+
+    assert len(results) == 2
+    assert integrator._breaker['openai']['fails'] == 0
+    assert integrator._breaker['huggingface']['fails'] == 0
+
+@pytest.mark.asyncio
+async def test_breaker_ignores_request_preparation_errors(integrator, services):
+    """Errors raised while building the request leave the breaker alone."""
+    async def call_service(session, service, request, context, timeout):
+        raise KeyError('model')
+
+    with patch.object(integrator, '_call_service', side_effect=call_service):
+        results = await integrator._process_with_services(MagicMock(), services, None)
+
+    assert results == []
+    assert integrator._breaker['openai']['fails'] == 0
+    assert integrator._breaker['huggingface']['fails'] == 0
+
+@pytest.mark.asyncio
+async def test_post_raises_for_error_status(integrator):
+    """_post turns a 429/5xx response into ClientResponseError instead of a result."""
+    response = MagicMock()
+    response.raise_for_status.side_effect = _http_error(429)
+    post = MagicMock()
+    post.return_value.__aenter__ = AsyncMock(return_value=response)
+    post.return_value.__aexit__ = AsyncMock(return_value=False)
+    session = MagicMock(post=post)
+    service_request = MagicMock(url='https://example.invalid', data={}, headers={})
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        await integrator._post(session, 'openai', service_request)
+
+def test_only_complete_success_is_cacheable(services):
+    """Responses are cached only when every selected service answered with 2xx."""
+    complete = [_result('openai', 200), _result('huggingface', 201)]
+
+    assert ExternalMLIntegrator._is_cacheable(complete, services)
+    assert not ExternalMLIntegrator._is_cacheable(complete[:1], services)
+    assert not ExternalMLIntegrator._is_cacheable([], ())
+    assert not ExternalMLIntegrator._is_cacheable(
+        [_result('openai', 200), _result('huggingface', 304)],
+        services
+    )
+
+def test_embedding_inputs_split_into_batches(integrator, services):
+    """Long list inputs to the embedding endpoint are split into EMBEDDING_BATCH_SIZE chunks."""
+    request = MagicMock(
+        parameters={'endpoint': 'embedding'},
+        input_data=list(range(EMBEDDING_BATCH_SIZE + 1))
+    )
+
+    service_requests = integrator._prepare_service_requests(services[0], request, None)
+
+    assert [len(call.data['input']) for call in service_requests] == [EMBEDDING_BATCH_SIZE, 1]
+
+@pytest.mark.parametrize('service_index, parameters, key', [
+    (0, {'endpoint': 'completion'}, 'input'),
+    (1, {'model': 'bert-base-uncased'}, 'inputs')
+])
+def test_other_endpoints_not_split(integrator, services, service_index, parameters, key):
+    """Endpoints outside _BATCHED_ENDPOINTS always receive the input whole."""
+    data = list(range(EMBEDDING_BATCH_SIZE + 1))
+    request = MagicMock(parameters=parameters, input_data=data)
+
+    service_requests = integrator._prepare_service_requests(services[service_index], request, None)
+
+    assert len(service_requests) == 1
+    assert service_requests[0].data[key] == data
+
+def test_unmergeable_batch_responses_raise():
+    """Batch responses of an unknown shape are rejected rather than merged."""
+    with pytest.raises(ValueError):
+        ExternalMLIntegrator._merge_batch_responses([{'embedding': [0.1]}, {'embedding': [0.2]}])
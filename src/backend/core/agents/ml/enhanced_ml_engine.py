@@ -1,14 +1,86 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
+from types import MappingProxyType
 import numpy as np
 from datetime import datetime
 import logging
 import openai
 import json
 import hashlib
+import functools
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Devanagari terms shared by Marathi, Sanskrit and Hindi (only 'rashi' differs)
+_DEVANAGARI_TERMS: Mapping[str, str] = MappingProxyType({
+    'lagna': 'लग्न',
+    'graha': 'ग्रह',
+    'dasha': 'दशा',
+    'yoga': 'योग',
+    'bhava': 'भाव',
+    'rashi': 'राशि',
+    'nakshatra': 'नक्षत्र'
+})
+
+# Astrological term translations per language (read-only, shared by all engines)
+_TERMS_BY_LANG = MappingProxyType({
+    'english': MappingProxyType({
+        'lagna': 'ascendant',
+        'graha': 'planet',
+        'dasha': 'planetary period',
+        'yoga': 'combination',
+        'bhava': 'house',
+        'rashi': 'sign',
+        'nakshatra': 'lunar mansion'
+    }),
+    'marathi': MappingProxyType({**_DEVANAGARI_TERMS, 'rashi': 'राशी'}),
+    'sanskrit': MappingProxyType(dict(_DEVANAGARI_TERMS)),
+    'hindi': MappingProxyType(dict(_DEVANAGARI_TERMS))
+})
+
+# Question templates per language (read-only, shared by all engines)
+_TEMPLATES_BY_LANG = MappingProxyType({
+    'english': MappingProxyType({
+        'timing': 'Did significant events related to {category} occur during {lord}\'s period?',
+        'aspect': 'Were there notable changes in {category} matters when {aspect} was prominent?',
+        'house': 'Did you experience changes in {house_significations} during this period?',
+        'combination': 'Was there a significant development in {area} when {planets} formed a combination?'
+    }),
+    'marathi': MappingProxyType({
+        'timing': '{lord} च्या काळात {category} संबंधित महत्त्वपूर्ण घटना घडल्या का?',
+        'aspect': 'जेव्हा {aspect} प्रभावी होता तेव्हा {category} मध्ये लक्षणीय बदल झाले का?',
+        'house': 'या काळात {house_significations} मध्ये बदल अनुभवला का?',
+        'combination': 'जेव्हा {planets} यांनी योग केला तेव्हा {area} मध्ये महत्त्वपूर्ण विकास झाला का?'
+    }),
+    'sanskrit': MappingProxyType({
+        'timing': '{lord} दशायां {category} सम्बन्धिताः महत्त्वपूर्णाः घटनाः अभवन् वा?',
+        'aspect': 'यदा {aspect} प्रभावी आसीत् तदा {category} विषये परिवर्तनं दृष्टं वा?',
+        'house': 'अस्मिन् काले {house_significations} विषये परिवर्तनम् अनुभूतं वा?',
+        'combination': 'यदा {planets} योगः अभवत् तदा {area} विषये महत्त्वपूर्णः विकासः अभवत् वा?'
+    }),
+    'hindi': MappingProxyType({
+        'timing': '{lord} की दशा में {category} से संबंधित महत्वपूर्ण घटनाएं हुईं क्या?',
+        'aspect': 'जब {aspect} प्रभावी था तब {category} में उल्लेखनीय बदलाव आए क्या?',
+        'house': 'इस काल में {house_significations} में बदलाव महसूस किया क्या?',
+        'combination': 'जब {planets} ने योग बनाया तब {area} में महत्वपूर्ण विकास हुआ क्या?'
+    })
+})
+
+# Identity lookup from a shared term table back to its language key
+_LANG_BY_TERMS_ID = {id(terms): lang for lang, terms in _TERMS_BY_LANG.items()}
+
+def _replace_terms(text: str, terms: Mapping[str, str]) -> str:
+    """Replace every known term in text with its translation."""
+    translated = text
+    for term, translation in terms.items():
+        translated = translated.replace(term, translation)
+    return translated
+
+@functools.lru_cache(maxsize=2048)
+def _translate_text_cached(text: str, language: str) -> str:
+    """Memoized translation against the immutable shared term tables."""
+    return _replace_terms(text, _TERMS_BY_LANG[language])
+
 class EnhancedMLEngine:
     """Enhanced ML engine with real-time learning and advanced pattern recognition."""
     
@@ -808,89 +880,37 @@ class EnhancedMLEngine:
         
         return min(1.0, priority)
     
-    def _load_english_terms(self) -> Dict[str, str]:
+    def _load_english_terms(self) -> Mapping[str, str]:
         """Load English astrological terms."""
-        return {
-            'lagna': 'ascendant',
-            'graha': 'planet',
-            'dasha': 'planetary period',
-            'yoga': 'combination',
-            'bhava': 'house',
-            'rashi': 'sign',
-            'nakshatra': 'lunar mansion'
-        }
+        return _TERMS_BY_LANG['english']
     
-    def _load_marathi_terms(self) -> Dict[str, str]:
+    def _load_marathi_terms(self) -> Mapping[str, str]:
         """Load Marathi astrological terms."""
-        return {
-            'lagna': 'लग्न',
-            'graha': 'ग्रह',
-            'dasha': 'दशा',
-            'yoga': 'योग',
-            'bhava': 'भाव',
-            'rashi': 'राशी',
-            'nakshatra': 'नक्षत्र'
-        }
+        return _TERMS_BY_LANG['marathi']
     
-    def _load_sanskrit_terms(self) -> Dict[str, str]:
+    def _load_sanskrit_terms(self) -> Mapping[str, str]:
         """Load Sanskrit astrological terms."""
-        return {
-            'lagna': 'लग्न',
-            'graha': 'ग्रह',
-            'dasha': 'दशा',
-            'yoga': 'योग',
-            'bhava': 'भाव',
-            'rashi': 'राशि',
-            'nakshatra': 'नक्षत्र'
-        }
+        return _TERMS_BY_LANG['sanskrit']
     
-    def _load_hindi_terms(self) -> Dict[str, str]:
+    def _load_hindi_terms(self) -> Mapping[str, str]:
         """Load Hindi astrological terms."""
-        return {
-            'lagna': 'लग्न',
-            'graha': 'ग्रह',
-            'dasha': 'दशा',
-            'yoga': 'योग',
-            'bhava': 'भाव',
-            'rashi': 'राशि',
-            'nakshatra': 'नक्षत्र'
-        }
+        return _TERMS_BY_LANG['hindi']
     
-    def _load_english_templates(self) -> Dict[str, str]:
+    def _load_english_templates(self) -> Mapping[str, str]:
         """Load English question templates."""
-        return {
-            'timing': 'Did significant events related to {category} occur during {lord}\'s period?',
-            'aspect': 'Were there notable changes in {category} matters when {aspect} was prominent?',
-            'house': 'Did you experience changes in {house_significations} during this period?',
-            'combination': 'Was there a significant development in {area} when {planets} formed a combination?'
-        }
+        return _TEMPLATES_BY_LANG['english']
     
-    def _load_marathi_templates(self) -> Dict[str, str]:
+    def _load_marathi_templates(self) -> Mapping[str, str]:
         """Load Marathi question templates."""
-        return {
-            'timing': '{lord} च्या काळात {category} संबंधित महत्त्वपूर्ण घटना घडल्या का?',
-            'aspect': 'जेव्हा {aspect} प्रभावी होता तेव्हा {category} मध्ये लक्षणीय बदल झाले का?',
-            'house': 'या काळात {house_significations} मध्ये बदल अनुभवला का?',
-            'combination': 'जेव्हा {planets} यांनी योग केला तेव्हा {area} मध्ये महत्त्वपूर्ण विकास झाला का?'
-        }
+        return _TEMPLATES_BY_LANG['marathi']
     
-    def _load_sanskrit_templates(self) -> Dict[str, str]:
+    def _load_sanskrit_templates(self) -> Mapping[str, str]:
         """Load Sanskrit question templates."""
-        return {
-            'timing': '{lord} दशायां {category} सम्बन्धिताः महत्त्वपूर्णाः घटनाः अभवन् वा?',
-            'aspect': 'यदा {aspect} प्रभावी आसीत् तदा {category} विषये परिवर्तनं दृष्टं वा?',
-            'house': 'अस्मिन् काले {house_significations} विषये परिवर्तनम् अनुभूतं वा?',
-            'combination': 'यदा {planets} योगः अभवत् तदा {area} विषये महत्त्वपूर्णः विकासः अभवत् वा?'
-        }
+        return _TEMPLATES_BY_LANG['sanskrit']
     
-    def _load_hindi_templates(self) -> Dict[str, str]:
+    def _load_hindi_templates(self) -> Mapping[str, str]:
         """Load Hindi question templates."""
-        return {
-            'timing': '{lord} की दशा में {category} से संबंधित महत्वपूर्ण घटनाएं हुईं क्या?',
-            'aspect': 'जब {aspect} प्रभावी था तब {category} में उल्लेखनीय बदलाव आए क्या?',
-            'house': 'इस काल में {house_significations} में बदलाव महसूस किया क्या?',
-            'combination': 'जब {planets} ने योग बनाया तब {area} में महत्वपूर्ण विकास हुआ क्या?'
-        }
+        return _TEMPLATES_BY_LANG['hindi']
     
     def generate_multilingual_questions(
         self,
@@ -996,12 +1016,10 @@ class EnhancedMLEngine:
         # Apply variables to template
         return template.format(**variables)
     
-    def _translate_text(self, text: str, terms: Dict[str, str]) -> str:
+    def _translate_text(self, text: str, terms: Mapping[str, str]) -> str:
         """Translate text using term mappings."""
-        translated = text
-        
-        # Replace terms with their translations
-        for term, translation in terms.items():
-            translated = translated.replace(term, translation)
-        
-        return translated 
\ No newline at end of file
+        # Shared term tables never change, so their translations can be memoized
+        language = _LANG_BY_TERMS_ID.get(id(terms))
+        if language is not None:
+            return _translate_text_cached(text, language)
+        return _replace_terms(text, terms) 
\ No newline at end of file
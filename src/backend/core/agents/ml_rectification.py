@@ -1,18 +1,135 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
+import copy
+import atexit
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import logging
 import json
+import orjson
 from datetime import datetime
+from io import StringIO
 import os
+import weakref
 from pathlib import Path
+import httpx
 from openai import AsyncOpenAI
+from pydantic import BaseModel, Field, ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Rolling window of cases kept for similarity scans and persistence
+MAX_CASE_HISTORY = 10_000
+
+# Maximum number of cases sent to GPT in a single batch request
+BATCH_SIZE = 8
+
+# Shared decoder used to locate the JSON object embedded in ML responses
+JSON_DECODER = json.JSONDecoder()
+
+# Static system message shared by every analysis request
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert astrologer and data scientist specializing in birth time rectification."
+}
+
+# Connection pool bounds for the shared OpenAI HTTP client
+OPENAI_MAX_CONNECTIONS = 32
+OPENAI_MAX_KEEPALIVE = 16
+
+# AsyncOpenAI clients shared across engine instances, keyed by event loop and then
+# API key: an httpx connection pool only works on the loop it was created on
+_OPENAI_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Optional[str], AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+def _get_client(api_key: Optional[str]) -> AsyncOpenAI:
+    """Return the running loop's shared AsyncOpenAI client for an API key, creating it on first use."""
+    clients = _OPENAI_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENAI_MAX_KEEPALIVE
+            ))
+        )
+        clients[api_key] = client
+    return client
+
+class ConfidenceFactors(BaseModel):
+    """Qualitative confidence factors reported by the ML analysis."""
+    record_quality: str = "medium"
+    pattern_match: str = "moderate"
+    historical_correlation: str = "neutral"
+
+class AnalysisResult(BaseModel):
+    """Schema for the ML analysis response, applying defaults for missing fields."""
+    time_adjustment: float = 0
+    confidence_score: float = 0.5
+    confidence_factors: ConfidenceFactors = Field(default_factory=ConfidenceFactors)
+    explanation: str = "Analysis completed with default confidence."
+    factors: Dict[str, Any] = Field(default_factory=dict)
+
+# Structure returned when the ML response cannot be parsed
+DEFAULT_ANALYSIS = AnalysisResult(
+    explanation="Unable to process detailed analysis. Using default values."
+).model_dump()
+
+def _validate_analysis(analysis: Any) -> Dict[str, Any]:
+    """Validate an ML analysis object, replacing only its invalid fields with their defaults."""
+    if not isinstance(analysis, dict):
+        raise ValueError("ML analysis is not a JSON object")
+    try:
+        return AnalysisResult.model_validate(analysis).model_dump()
+    except ValidationError as e:
+        logger.warning(f"Invalid fields in ML analysis, using defaults for them: {e}")
+        cleaned = copy.deepcopy(analysis)
+        for error in e.errors():
+            # Drop the innermost mapping key on the error path so its default applies
+            *parents, field = error["loc"]
+            target = cleaned
+            for key in parents:
+                target = target.get(key) if isinstance(target, dict) else None
+            if isinstance(target, dict):
+                target.pop(field, None)
+        return AnalysisResult.model_validate(cleaned).model_dump()
+
+# Live engines, held weakly, whose pending learning-file writes are flushed at exit
+_ENGINES: "weakref.WeakSet[MLRectificationEngine]" = weakref.WeakSet()
+
+def _flush_engines() -> None:
+    """Write every live engine's dirty learning files; registered with atexit once."""
+    for engine in list(_ENGINES):
+        try:
+            engine._flush_pending()
+        except Exception as e:
+            logger.error(f"Error flushing learning data at exit: {str(e)}")
+
+atexit.register(_flush_engines)
+
+def _birth_hour(birth_data: Any) -> int:
+    """Return the birth hour, parsing it once and caching it on dict inputs."""
+    if isinstance(birth_data, dict):
+        hour = birth_data.get("hour")
+        if hour is None:
+            hour = birth_data["hour"] = int(birth_data["time"].split(":", 1)[0])
+        return hour
+    return birth_data.hour
+
+def _safe_birth_hour(birth_data: Any) -> Optional[int]:
+    """Return the birth hour, or None when the birth data has no parseable time."""
+    try:
+        return _birth_hour(birth_data)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
 class MLRectificationEngine:
     def __init__(self, api_key: Optional[str] = None):
         """Initialize ML rectification engine with learning capabilities."""
         self.api_key = api_key
-        self.client = AsyncOpenAI(api_key=api_key)
         
         # Initialize learning database paths
         self.data_dir = Path(__file__).parent.parent.parent / "data" / "ml_learning"
@@ -22,26 +139,50 @@ class MLRectificationEngine:
         self.learning_patterns_file = self.data_dir / "learning_patterns.json"
         self.confidence_metrics_file = self.data_dir / "confidence_metrics.json"
         
+        # Debounced persistence state for the per-request learning files
+        self._dirty = {"history": False, "patterns": False, "metrics": False}
+        self._flusher_task: Optional[asyncio.Task] = None
+        _ENGINES.add(self)
+        
+        # Formatted learning-pattern prompt lines per birth hour
+        self._patterns_prompt_cache: Optional[Dict[int, str]] = None
+        
         # Initialize or load learning data
         self._initialize_learning_data()
         
         logger.info("ML Rectification Engine initialized with learning capabilities")
 
+    @property
+    def client(self) -> AsyncOpenAI:
+        """The shared OpenAI client for this engine's API key on the running event loop."""
+        return _get_client(self.api_key)
+
     def _initialize_learning_data(self):
         """Initialize or load learning data from files."""
         try:
+            # Read all three state files in parallel; startup waits on the slowest only
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                history, patterns, metrics = executor.map(self._load_json_or_none, [
+                    self.case_history_file,
+                    self.learning_patterns_file,
+                    self.confidence_metrics_file
+                ])
+
             # Initialize case history
-            if self.case_history_file.exists():
-                with open(self.case_history_file, 'r') as f:
-                    self.case_history = json.load(f)
+            if history is not None:
+                self.case_history = deque(history, maxlen=MAX_CASE_HISTORY)
             else:
-                self.case_history = []
+                self.case_history = deque(maxlen=MAX_CASE_HISTORY)
                 self._save_case_history()
 
+            # Build the hour -> confidence scores index used for similar-case lookup
+            self._cases_by_hour: Dict[int, deque] = {}
+            for case in self.case_history:
+                self._index_case(case)
+
             # Initialize learning patterns
-            if self.learning_patterns_file.exists():
-                with open(self.learning_patterns_file, 'r') as f:
-                    self.learning_patterns = json.load(f)
+            if patterns is not None:
+                self.learning_patterns = patterns
             else:
                 self.learning_patterns = {
                     "time_correlations": {},
@@ -56,9 +197,8 @@ class MLRectificationEngine:
                 self._save_learning_patterns()
 
             # Initialize confidence metrics
-            if self.confidence_metrics_file.exists():
-                with open(self.confidence_metrics_file, 'r') as f:
-                    self.confidence_metrics = json.load(f)
+            if metrics is not None:
+                self.confidence_metrics = metrics
             else:
                 self.confidence_metrics = {
                     "threshold_adjustments": [],
@@ -75,20 +215,72 @@ class MLRectificationEngine:
             logger.error(f"Error initializing learning data: {str(e)}")
             raise
 
+    @staticmethod
+    def _load_json_or_none(path: Path) -> Optional[Any]:
+        """Load a JSON file, returning None when it does not exist yet."""
+        if not path.exists():
+            return None
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+
+    def _serialize_state(self, kind: str) -> Tuple[Path, bytes]:
+        """Return the file and JSON bytes for one kind of learning state."""
+        if kind == "history":
+            return self.case_history_file, orjson.dumps(list(self.case_history), option=orjson.OPT_INDENT_2)
+        if kind == "patterns":
+            return self.learning_patterns_file, orjson.dumps(self.learning_patterns, option=orjson.OPT_INDENT_2)
+        return self.confidence_metrics_file, orjson.dumps(self.confidence_metrics, option=orjson.OPT_INDENT_2)
+
     def _save_case_history(self):
         """Save case history to file."""
-        with open(self.case_history_file, 'w') as f:
-            json.dump(self.case_history, f, indent=2)
+        path, data = self._serialize_state("history")
+        path.write_bytes(data)
 
     def _save_learning_patterns(self):
         """Save learning patterns to file."""
-        with open(self.learning_patterns_file, 'w') as f:
-            json.dump(self.learning_patterns, f, indent=2)
+        path, data = self._serialize_state("patterns")
+        path.write_bytes(data)
 
     def _save_confidence_metrics(self):
         """Save confidence metrics to file."""
-        with open(self.confidence_metrics_file, 'w') as f:
-            json.dump(self.confidence_metrics, f, indent=2)
+        path, data = self._serialize_state("metrics")
+        path.write_bytes(data)
+
+    def _schedule_flush(self, kind: str, delay: float = 1.0):
+        """Mark a learning file dirty and coalesce its write into a delayed flush."""
+        self._dirty[kind] = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync caller): persist immediately
+            self._flush_pending()
+            return
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = loop.create_task(self._flush_after(delay))
+
+    async def _flush_after(self, delay: float):
+        """Write dirty files off the event loop after each debounce window until none remain.
+        
+        State is serialized on the loop, so the worker thread never reads it while it
+        changes; anything marked dirty during a write is picked up by the next round.
+        """
+        while True:
+            await asyncio.sleep(delay)
+            dirty = [kind for kind, flag in self._dirty.items() if flag]
+            if not dirty:
+                return
+            for kind in dirty:
+                self._dirty[kind] = False
+                path, data = self._serialize_state(kind)
+                await asyncio.to_thread(path.write_bytes, data)
+
+    def _flush_pending(self):
+        """Synchronously write any learning files still marked dirty."""
+        for kind, flag in self._dirty.items():
+            if flag:
+                self._dirty[kind] = False
+                path, data = self._serialize_state(kind)
+                path.write_bytes(data)
 
     def _update_learning_patterns(self, birth_data: Dict[str, Any], 
                                 analysis_result: Dict[str, Any],
@@ -111,7 +303,7 @@ class MLRectificationEngine:
             )
 
             # Update time correlations
-            birth_hour = int(birth_data["time"].split(":")[0])
+            birth_hour = _birth_hour(birth_data)
             time_key = f"hour_{birth_hour}"
             if time_key not in self.learning_patterns["time_correlations"]:
                 self.learning_patterns["time_correlations"][time_key] = {
@@ -130,8 +322,11 @@ class MLRectificationEngine:
                 time_stats["count"] / self.learning_patterns["success_metrics"]["total_cases"]
             )
 
-            # Save updated patterns
-            self._save_learning_patterns()
+            # Prompt lines embed these metrics, so rebuild them on next use
+            self._patterns_prompt_cache = None
+
+            # Schedule a debounced save of the updated patterns
+            self._schedule_flush("patterns")
             
         except Exception as e:
             logger.error(f"Error updating learning patterns: {str(e)}")
@@ -153,60 +348,112 @@ class MLRectificationEngine:
             # Generate analysis prompt
             prompt = self._generate_analysis_prompt(analysis_context)
 
-            # Get ML analysis from OpenAI
-            response = await self.client.chat.completions.create(
+            # Response-independent confidence factors, from the learning state as of this request
+            pattern_confidences = self._compute_pattern_confidences(birth_data)
+
+            # Stream ML analysis from OpenAI
+            stream = await self.client.chat.completions.create(
                 model="gpt-4",
                 messages=[
-                    {"role": "system", "content": "You are an expert astrologer and data scientist specializing in birth time rectification."},
+                    SYSTEM_MESSAGE,
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.3
+                temperature=0.3,
+                stream=True
             )
+            response_text = await self._collect_streamed_response(stream)
 
             # Process ML response
-            analysis_result = self._process_ml_response(response.choices[0].message.content)
+            analysis_result = self._process_ml_response(response_text)
 
-            # Calculate confidence score
-            confidence_score = await self.evaluate_confidence(birth_data, {
-                "analysis_results": analysis_result,
-                "questionnaire_responses": questionnaire_responses
-            })
+            # Score the case, learn from it and record it in history
+            result = await self._finalize_case(
+                birth_data, questionnaire_responses, analysis_result,
+                pattern_confidences=pattern_confidences
+            )
+            self._schedule_flush("history")
+            return result
 
-            # Update learning patterns with new case data
-            self._update_learning_patterns(birth_data, analysis_result, confidence_score)
+        except Exception as e:
+            logger.error(f"Error in ML analysis: {str(e)}")
+            raise
 
-            # Add case to history
-            case_data = {
-                "timestamp": datetime.now().isoformat(),
-                "birth_data": birth_data,
-                "analysis_result": analysis_result,
-                "confidence_score": confidence_score
-            }
-            self.case_history.append(case_data)
-            self._save_case_history()
-
-            # Return enhanced analysis results
-            return {
-                "time_adjustment": analysis_result.get("time_adjustment", 0),
-                "confidence_score": confidence_score,
-                "factors": analysis_result.get("factors", {}),
-                "explanation": analysis_result.get("explanation", ""),
-                "learning_metrics": {
-                    "total_cases_analyzed": self.learning_patterns["success_metrics"]["total_cases"],
-                    "average_confidence": self.learning_patterns["success_metrics"]["average_confidence"],
-                    "pattern_strength": self._calculate_pattern_strength(birth_data)
-                }
-            }
+    async def analyze_birth_data_batch(self, cases: List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]
+                                       ) -> List[Dict[str, Any]]:
+        """Analyze several (birth_data, planetary_positions, questionnaire_responses) cases
+        with one GPT request per group of up to BATCH_SIZE cases."""
+        try:
+            results = []
+            for offset in range(0, len(cases), BATCH_SIZE):
+                batch = cases[offset:offset + BATCH_SIZE]
+
+                # Get ML analysis for the whole group in a single round-trip
+                prompt = self._generate_batch_analysis_prompt(batch)
+                response = await self.client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[
+                        SYSTEM_MESSAGE,
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.3
+                )
+                analysis_results = self._process_ml_batch_response(
+                    response.choices[0].message.content, len(batch)
+                )
+
+                for (birth_data, _, questionnaire_responses), analysis_result in zip(batch, analysis_results):
+                    results.append(await self._finalize_case(
+                        birth_data, questionnaire_responses, analysis_result
+                    ))
+                self._schedule_flush("history")
+
+            return results
 
         except Exception as e:
-            logger.error(f"Error in ML analysis: {str(e)}")
+            logger.error(f"Error in batch ML analysis: {str(e)}")
             raise
 
+    async def _finalize_case(self, birth_data: Dict[str, Any],
+                             questionnaire_responses: Dict[str, Any],
+                             analysis_result: Dict[str, Any],
+                             pattern_confidences: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
+        """Score an analyzed case, update learning state and build the response."""
+        # Calculate confidence score
+        confidence_score = await self.evaluate_confidence(birth_data, {
+            "analysis_results": analysis_result,
+            "questionnaire_responses": questionnaire_responses
+        }, pattern_confidences=pattern_confidences)
+
+        # Update learning patterns with new case data
+        self._update_learning_patterns(birth_data, analysis_result, confidence_score)
+
+        # Add case to history
+        case_data = {
+            "timestamp": datetime.now().isoformat(),
+            "birth_data": birth_data,
+            "analysis_result": analysis_result,
+            "confidence_score": confidence_score
+        }
+        self._record_case(case_data)
+
+        # Return enhanced analysis results
+        return {
+            "time_adjustment": analysis_result.get("time_adjustment", 0),
+            "confidence_score": confidence_score,
+            "factors": analysis_result.get("factors", {}),
+            "explanation": analysis_result.get("explanation", ""),
+            "learning_metrics": {
+                "total_cases_analyzed": self.learning_patterns["success_metrics"]["total_cases"],
+                "average_confidence": self.learning_patterns["success_metrics"]["average_confidence"],
+                "pattern_strength": self._calculate_pattern_strength(birth_data)
+            }
+        }
+
     def _generate_analysis_prompt(self, context: Dict[str, Any]) -> str:
         """Generate detailed analysis prompt incorporating learning patterns."""
         birth_data = context["birth_data"]
         questionnaire = context["questionnaire_responses"]
-        learning_patterns = context["learning_patterns"]
+        patterns_section = self._get_patterns_prompt(_birth_hour(birth_data))
 
         prompt = f"""
         Analyze the following birth time rectification case and provide a response in JSON format with the following structure:
@@ -230,12 +477,10 @@ class MLRectificationEngine:
         - Location: {birth_data['location']}
         
         Historical Learning Patterns:
-        - Total cases analyzed: {learning_patterns['success_metrics']['total_cases']}
-        - Average confidence: {learning_patterns['success_metrics']['average_confidence']:.2%}
-        - Similar time pattern success rate: {self._get_time_pattern_success_rate(birth_data['time']):.2%}
+{patterns_section}
         
         Questionnaire Responses:
-        {json.dumps(questionnaire, indent=2)}
+        {orjson.dumps(questionnaire, option=orjson.OPT_INDENT_2).decode()}
         
         Based on the above data and learning patterns:
         1. Analyze the birth time accuracy
@@ -247,57 +492,165 @@ class MLRectificationEngine:
         """
         return prompt
 
+    def _generate_batch_analysis_prompt(self, cases: List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]) -> str:
+        """Generate a single prompt asking for one analysis per case as a JSON array."""
+        case_sections = []
+        for index, (birth_data, _, questionnaire) in enumerate(cases, start=1):
+            case_sections.append(f"""
+        Case {index}:
+        Birth Details:
+        - Date: {birth_data['date']}
+        - Time: {birth_data['time']}
+        - Location: {birth_data['location']}
+        
+        Historical Learning Patterns:
+{self._get_patterns_prompt(_birth_hour(birth_data))}
+        
+        Questionnaire Responses:
+        {orjson.dumps(questionnaire, option=orjson.OPT_INDENT_2).decode()}
+        """)
+
+        prompt = f"""
+        Analyze the following {len(cases)} birth time rectification cases and respond with a JSON array
+        of exactly {len(cases)} objects, in case order, each with the following structure:
+        {{
+            "time_adjustment": <number: hours to adjust, can be negative>,
+            "confidence_score": <number between 0 and 1>,
+            "confidence_factors": {{
+                "record_quality": <string: "low", "medium", or "high">,
+                "pattern_match": <string: "weak", "moderate", or "strong">,
+                "historical_correlation": <string: "negative", "neutral", or "positive">
+            }},
+            "explanation": <string: detailed explanation>,
+            "factors": {{
+                <key-value pairs of relevant factors>
+            }}
+        }}
+        {"".join(case_sections)}
+        For each case, based on its data and the learning patterns:
+        1. Analyze the birth time accuracy
+        2. Suggest any necessary adjustments
+        3. Explain the confidence level
+        4. Identify key factors influencing the analysis
+        
+        IMPORTANT: Ensure the response is a valid JSON array with one object per case containing all the required fields as shown in the structure above.
+        """
+        return prompt
+
+    async def _collect_streamed_response(self, stream) -> str:
+        """Accumulate a streamed completion, stopping once the JSON object closes."""
+        buffer = StringIO()
+        depth = 0
+        in_string = False
+        escaped = False
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if not content:
+                    continue
+                buffer.write(content)
+
+                # Track brace depth outside of JSON strings
+                for char in content:
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif char == "\\":
+                            escaped = True
+                        elif char == '"':
+                            in_string = False
+                    elif char == '"' and depth > 0:
+                        in_string = True
+                    elif char == "{":
+                        depth += 1
+                    elif char == "}" and depth > 0:
+                        depth -= 1
+                        if depth == 0:
+                            return buffer.getvalue()
+            return buffer.getvalue()
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                await close()
+
+    def _get_patterns_prompt(self, hour: int) -> str:
+        """Return the formatted learning-pattern prompt lines, cached until patterns change."""
+        if self._patterns_prompt_cache is None:
+            self._patterns_prompt_cache = {}
+        section = self._patterns_prompt_cache.get(hour)
+        if section is None:
+            success_metrics = self.learning_patterns["success_metrics"]
+            section = (
+                f"        - Total cases analyzed: {success_metrics['total_cases']}\n"
+                f"        - Average confidence: {success_metrics['average_confidence']:.2%}\n"
+                f"        - Similar time pattern success rate: {self._get_time_pattern_success_rate(hour):.2%}"
+            )
+            self._patterns_prompt_cache[hour] = section
+        return section
+
     def _process_ml_response(self, response_text: str) -> Dict[str, Any]:
         """Process and structure the ML response."""
         try:
-            # Extract JSON from response
+            # Parse the first JSON object in the response in a single pass
             start_idx = response_text.find("{")
-            end_idx = response_text.rfind("}") + 1
-            json_str = response_text[start_idx:end_idx]
+            if start_idx == -1:
+                raise ValueError("No JSON object found in ML response")
+            analysis, _ = JSON_DECODER.raw_decode(response_text, start_idx)
             
-            # Parse and validate response
-            analysis = json.loads(json_str)
-            
-            # Ensure required fields exist with default values if missing
-            processed_analysis = {
-                "time_adjustment": analysis.get("time_adjustment", 0),
-                "confidence_score": analysis.get("confidence_score", 0.5),
-                "confidence_factors": analysis.get("confidence_factors", {
-                    "record_quality": "medium",
-                    "pattern_match": "moderate",
-                    "historical_correlation": "neutral"
-                }),
-                "explanation": analysis.get("explanation", "Analysis completed with default confidence."),
-                "factors": analysis.get("factors", {})
-            }
-            
-            return processed_analysis
+            # Validate and fill defaults for missing or invalid fields
+            return _validate_analysis(analysis)
             
         except Exception as e:
             logger.error(f"Error processing ML response: {str(e)}")
             # Return a default analysis structure
-            return {
-                "time_adjustment": 0,
-                "confidence_score": 0.5,
-                "confidence_factors": {
-                    "record_quality": "medium",
-                    "pattern_match": "moderate",
-                    "historical_correlation": "neutral"
-                },
-                "explanation": "Unable to process detailed analysis. Using default values.",
-                "factors": {}
-            }
+            return copy.deepcopy(DEFAULT_ANALYSIS)
+
+    def _process_ml_batch_response(self, response_text: str, expected: int) -> List[Dict[str, Any]]:
+        """Process a JSON array response into exactly `expected` structured analyses."""
+        try:
+            start_idx = response_text.find("[")
+            if start_idx == -1:
+                raise ValueError("No JSON array found in ML response")
+            analyses, _ = JSON_DECODER.raw_decode(response_text, start_idx)
+            if not isinstance(analyses, list):
+                raise ValueError("ML batch response is not a JSON array")
+        except Exception as e:
+            logger.error(f"Error processing ML batch response: {str(e)}")
+            analyses = []
+
+        processed = []
+        for analysis in analyses[:expected]:
+            try:
+                processed.append(_validate_analysis(analysis))
+            except Exception as e:
+                logger.error(f"Error processing ML batch item: {str(e)}")
+                processed.append(copy.deepcopy(DEFAULT_ANALYSIS))
+
+        # Cases the model left out fall back to the default analysis
+        while len(processed) < expected:
+            processed.append(copy.deepcopy(DEFAULT_ANALYSIS))
+        return processed
+
+    def _compute_pattern_confidences(self, birth_data: Dict[str, Any]) -> Tuple[float, float]:
+        """Compute the learning-based confidence factors that do not depend on the ML response."""
+        time_pattern_confidence = self._get_time_pattern_confidence(_birth_hour(birth_data))
+        historical_pattern_confidence = self._get_historical_pattern_confidence(birth_data)
+        return time_pattern_confidence, historical_pattern_confidence
 
     async def evaluate_confidence(self, birth_data: Dict[str, Any],
-                                analysis_context: Dict[str, Any]) -> float:
+                                analysis_context: Dict[str, Any],
+                                pattern_confidences: Optional[Tuple[float, float]] = None) -> float:
         """Evaluate confidence in the rectification results with learning enhancement."""
         try:
             # Get base confidence from analysis
             base_confidence = float(analysis_context["analysis_results"].get("confidence_score", 0.5))
             
-            # Apply learning-based adjustments
-            time_pattern_confidence = self._get_time_pattern_confidence(birth_data["time"])
-            historical_pattern_confidence = self._get_historical_pattern_confidence(birth_data)
+            # Apply learning-based adjustments (reuse precomputed factors if provided)
+            if pattern_confidences is None:
+                pattern_confidences = self._compute_pattern_confidences(birth_data)
+            time_pattern_confidence, historical_pattern_confidence = pattern_confidences
             
             # Weight the confidence factors
             final_confidence = (
@@ -316,7 +669,7 @@ class MLRectificationEngine:
                     "historical_pattern": historical_pattern_confidence
                 }
             })
-            self._save_confidence_metrics()
+            self._schedule_flush("metrics")
             
             return min(1.0, max(0.0, final_confidence))
             
@@ -324,68 +677,76 @@ class MLRectificationEngine:
             logger.error(f"Error in confidence evaluation: {str(e)}")
             raise
 
-    def _get_time_pattern_confidence(self, birth_time: str) -> float:
+    def _get_time_pattern_confidence(self, hour: int) -> float:
         """Calculate confidence based on time patterns."""
-        try:
-            hour = int(birth_time.split(":")[0])
-            time_key = f"hour_{hour}"
-            
-            if time_key in self.learning_patterns["time_correlations"]:
-                stats = self.learning_patterns["time_correlations"][time_key]
-                return stats["avg_confidence"] * stats["success_rate"]
-            return 0.5
-        except:
+        stats = self.learning_patterns["time_correlations"].get(f"hour_{hour}")
+        if stats is None:
             return 0.5
+        return stats["avg_confidence"] * stats["success_rate"]
 
     def _get_historical_pattern_confidence(self, birth_data: Dict[str, Any]) -> float:
         """Calculate confidence based on historical patterns."""
-        try:
-            if not self.case_history:
-                return 0.5
-                
-            similar_cases = [
-                case for case in self.case_history
-                if self._is_similar_case(case["birth_data"], birth_data)
-            ]
-            
-            if not similar_cases:
-                return 0.5
-                
-            return sum(case["confidence_score"] for case in similar_cases) / len(similar_cases)
-        except:
+        hour = _safe_birth_hour(birth_data)
+        if hour is None:
+            return 0.5
+        similar_scores = self._similar_case_scores(hour)
+        if not similar_scores:
             return 0.5
+        return sum(similar_scores) / len(similar_scores)
 
-    def _is_similar_case(self, case1: Dict[str, Any], case2: Dict[str, Any]) -> bool:
-        """Determine if two cases are similar based on key factors."""
-        try:
-            # Compare birth times within 2-hour window
-            time1 = int(case1["time"].split(":")[0])
-            time2 = int(case2["time"].split(":")[0])
-            return abs(time1 - time2) <= 2
-        except:
-            return False
-
-    def _get_time_pattern_success_rate(self, birth_time: str) -> float:
+    @staticmethod
+    def _case_hour(case: Dict[str, Any]) -> Optional[int]:
+        """Return the birth hour of a stored case, or None if it cannot be parsed."""
+        return _safe_birth_hour(case.get("birth_data"))
+
+    @classmethod
+    def _indexed_hour(cls, case: Dict[str, Any]) -> Optional[int]:
+        """Return the hour bucket a case is indexed under, or None if it is not indexed.
+        
+        Cases without a parseable birth hour or a confidence_score stay out of the index.
+        """
+        if case.get("confidence_score") is None:
+            return None
+        return cls._case_hour(case)
+
+    def _index_case(self, case: Dict[str, Any]):
+        """Add a case's confidence score to its hour bucket."""
+        hour = self._indexed_hour(case)
+        if hour is not None:
+            self._cases_by_hour.setdefault(hour, deque()).append(case.get("confidence_score"))
+
+    def _record_case(self, case: Dict[str, Any]):
+        """Append a case to the rolling history, keeping the hour index in sync."""
+        if len(self.case_history) == self.case_history.maxlen:
+            # Buckets hold cases in append order, so the evicted case is at the front
+            evicted_hour = self._indexed_hour(self.case_history[0])
+            if evicted_hour is not None:
+                self._cases_by_hour[evicted_hour].popleft()
+        self.case_history.append(case)
+        self._index_case(case)
+
+    def _similar_case_scores(self, hour: int) -> List[float]:
+        """Return confidence scores of cases within the 2-hour similarity window."""
+        return list(itertools.chain.from_iterable(
+            self._cases_by_hour.get(h, ()) for h in range(hour - 2, hour + 3)
+        ))
+
+    def _get_time_pattern_success_rate(self, hour: int) -> float:
         """Get success rate for similar time patterns."""
-        try:
-            hour = int(birth_time.split(":")[0])
-            time_key = f"hour_{hour}"
-            
-            if time_key in self.learning_patterns["time_correlations"]:
-                return self.learning_patterns["time_correlations"][time_key]["success_rate"]
-            return 0.0
-        except:
+        stats = self.learning_patterns["time_correlations"].get(f"hour_{hour}")
+        if stats is None:
             return 0.0
+        return stats["success_rate"]
 
     def _calculate_pattern_strength(self, birth_data: Dict[str, Any]) -> float:
         """Calculate the strength of pattern matching for the current case."""
-        try:
-            time_pattern_strength = self._get_time_pattern_success_rate(birth_data["time"])
-            historical_pattern_strength = len([
-                case for case in self.case_history
-                if self._is_similar_case(case["birth_data"], birth_data)
-            ]) / max(1, len(self.case_history))
-            
-            return (time_pattern_strength + historical_pattern_strength) / 2
-        except:
+        hour = _safe_birth_hour(birth_data)
+        if hour is None:
             return 0.0
+        time_pattern_strength = self._get_time_pattern_success_rate(hour)
+        similar_count = sum(
+            len(self._cases_by_hour.get(h, ())) for h in range(hour - 2, hour + 3)
+        )
+        historical_pattern_strength = similar_count / max(1, len(self.case_history))
+        
+        return (time_pattern_strength + historical_pattern_strength) / 2
@@ -3,10 +3,18 @@ Birth Data Model
 Contains the data structure for birth details.
 """
 
+import re
 from datetime import datetime
 from typing import Any, Optional
 
+# Accepted input date layouts
+_DMY_PATTERN = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
+_YMD_PATTERN = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
+
 class BirthData:
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = ('date', 'time', 'hour', 'place', 'latitude', 'longitude', 'timezone')
+
     def __init__(self, date: str, time: str, place: str, latitude: float = None, longitude: float = None):
         """
         Initialize birth data.
@@ -20,6 +28,7 @@ class BirthData:
         """
         self.date = self._normalize_date(date)
         self.time = time
+        self.hour = int(time.split(':', 1)[0])
         self.place = place
         self.latitude = latitude
         self.longitude = longitude
@@ -27,16 +36,20 @@ class BirthData:
 
     def _normalize_date(self, date: str) -> str:
         """Convert date to YYYY-MM-DD format."""
+        match = _DMY_PATTERN.match(date)
+        if match:
+            day, month, year = map(int, match.groups())
+        else:
+            match = _YMD_PATTERN.match(date)
+            if not match:
+                raise ValueError(f"Invalid date format: {date}. Expected DD/MM/YYYY or YYYY-MM-DD")
+            year, month, day = map(int, match.groups())
         try:
-            # Try DD/MM/YYYY format first
-            dt = datetime.strptime(date, "%d/%m/%Y")
+            # Validate calendar values without a strptime round-trip
+            datetime(year, month, day)
         except ValueError:
-            try:
-                # Try YYYY-MM-DD format
-                dt = datetime.strptime(date, "%Y-%m-%d")
-            except ValueError:
-                raise ValueError(f"Invalid date format: {date}. Expected DD/MM/YYYY or YYYY-MM-DD")
-        return dt.strftime("%Y-%m-%d")
+            raise ValueError(f"Invalid date format: {date}. Expected DD/MM/YYYY or YYYY-MM-DD")
+        return f"{year:04d}-{month:02d}-{day:02d}"
 
     def get(self, key: str, default: Any = None) -> Any:
         """Dictionary-like get method."""
@@ -1,33 +1,135 @@
-from typing import Dict, Any, List, Optional, Callable
+from typing import TYPE_CHECKING, Dict, DefaultDict, Any, List, Optional, Callable, Tuple
 import re
+from functools import lru_cache
 from datetime import datetime
 import logging
 from pathlib import Path
 import json
-import numpy as np
-from ..ml.enhanced_ml_engine import EnhancedMLEngine
+import os
+import sys
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+if TYPE_CHECKING:
+    # numpy and the ML engine are imported where used so plain validation stays lightweight
+    import numpy as np
+    from ..ml.enhanced_ml_engine import EnhancedMLEngine
 
 logger = logging.getLogger(__name__)
 
+try:
+    # Optional fast JSON parser for the rules configuration
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional linear-time DFA regex engine, used by pattern rules that opt in
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    # Optional JIT compiler for the scalar z-score kernel
+    from numba import njit
+except ImportError:
+    njit = None
+
+def _zscore_exceeds(value: float, mean: float, std: float) -> bool:
+    """Whether value lies more than 3 standard deviations from the mean."""
+    return abs(value - mean) / (std if std > 1e-6 else 1e-6) > 3.0
+
+if njit is not None:
+    _zscore_exceeds = njit(cache=True)(_zscore_exceeds)
+
+# Type names accepted in the "type" entry of the rules configuration
+_TYPE_REGISTRY = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "list": list,
+    "dict": dict,
+    "bool": bool
+}
+
+@lru_cache(maxsize=256)
+def _compiled(pattern: str, flags: int = 0, use_re2: bool = False) -> re.Pattern:
+    """Compile a pattern once; rules sharing a pattern share the compiled object.
+    
+    With use_re2, RE2 is used when installed, falling back to the stdlib engine
+    for flags or constructs RE2 does not support (e.g. backreferences,
+    lookarounds). RE2 matches differently from re (``$`` does not match before
+    a trailing newline, ``\\d`` is ASCII-only), so it is never the default.
+    """
+    if use_re2 and re2 is not None and not flags:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+# Well-known formats, compiled once and shared by every rule that uses them
+DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+TIME_RE = re.compile(r'^\d{2}:\d{2}(:\d{2})?$')
+NUMBER_RE = re.compile(r'^[-+]?\d*\.?\d+$')
+_WELL_KNOWN_PATTERNS = {compiled.pattern: compiled for compiled in (DATE_RE, TIME_RE, NUMBER_RE)}
+
+# Sentinel passed to compiled rule checks when a field is absent from the data
+_MISSING = object()
+
+# Number of most recent timings kept per performance metric
+METRICS_WINDOW = 4096
+
+# Minimum number of fields before field validation is fanned out to threads
+# (only with parallel=True)
+PARALLEL_MIN_FIELDS = 16
+
 class ValidationRule:
     """Base class for validation rules."""
+    __slots__ = ("field", "message")
+    
     def __init__(self, field: str, message: str):
         self.field = field
-        self.message = message
+        # Interned so repeated errors share one string object
+        self.message = sys.intern(message) if isinstance(message, str) else message
     
     def validate(self, data: Dict[str, Any]) -> Optional[str]:
         """Validate data against rule."""
         raise NotImplementedError
+    
+    def compile(self) -> Callable[[Any, Dict[str, Any]], Optional[str]]:
+        """Build a check taking (field value or _MISSING, data) with rule state captured.
+        
+        Rules without a specialized check fall back to validate(data).
+        """
+        validate = self.validate
+        return lambda value, data: validate(data)
+    
+    def _overrides_validate(self, base: type) -> bool:
+        """Whether a subclass replaced base.validate, so base's specialized check would bypass it."""
+        return type(self).validate is not base.validate
 
 class RequiredRule(ValidationRule):
     """Rule for required fields."""
+    __slots__ = ()
+    
     def validate(self, data: Dict[str, Any]) -> Optional[str]:
         if self.field not in data or data[self.field] is None:
             return self.message
         return None
+    
+    def compile(self) -> Callable[[Any, Dict[str, Any]], Optional[str]]:
+        if self._overrides_validate(RequiredRule):
+            return ValidationRule.compile(self)
+        message = self.message
+        return lambda value, data: message if value is _MISSING or value is None else None
 
 class TypeRule(ValidationRule):
     """Rule for type checking."""
+    __slots__ = ("expected_type",)
+    
     def __init__(self, field: str, expected_type: type, message: str):
         super().__init__(field, message)
         self.expected_type = expected_type
@@ -36,34 +138,78 @@ class TypeRule(ValidationRule):
         if self.field in data and not isinstance(data[self.field], self.expected_type):
             return self.message
         return None
+    
+    def compile(self) -> Callable[[Any, Dict[str, Any]], Optional[str]]:
+        if self._overrides_validate(TypeRule):
+            return ValidationRule.compile(self)
+        expected_type, message = self.expected_type, self.message
+        return lambda value, data: (
+            message if value is not _MISSING and not isinstance(value, expected_type) else None
+        )
 
 class RangeRule(ValidationRule):
     """Rule for numerical range validation."""
+    __slots__ = ("min_val", "max_val", "_check")
+    
     def __init__(self, field: str, min_val: float, max_val: float, message: str):
         super().__init__(field, message)
         self.min_val = min_val
         self.max_val = max_val
+        # Loaded with a single attribute access in validate()
+        self._check = (min_val, max_val, self.message)
     
     def validate(self, data: Dict[str, Any]) -> Optional[str]:
         if self.field in data:
             value = data[self.field]
-            if not isinstance(value, (int, float)) or value < self.min_val or value > self.max_val:
-                return self.message
+            min_val, max_val, message = self._check
+            return None if isinstance(value, (int, float)) and min_val <= value <= max_val else message
         return None
+    
+    def validate_array(self, values: "np.ndarray") -> "np.ndarray":
+        """Return a mask of out-of-range (or NaN) entries for a numeric column."""
+        return ~((values >= self.min_val) & (values <= self.max_val))
+    
+    def compile(self) -> Callable[[Any, Dict[str, Any]], Optional[str]]:
+        if self._overrides_validate(RangeRule):
+            return ValidationRule.compile(self)
+        min_val, max_val, message = self.min_val, self.max_val, self.message
+        
+        def check(value: Any, data: Dict[str, Any]) -> Optional[str]:
+            if value is _MISSING:
+                return None
+            return None if isinstance(value, (int, float)) and min_val <= value <= max_val else message
+        return check
 
 class PatternRule(ValidationRule):
     """Rule for pattern matching."""
-    def __init__(self, field: str, pattern: str, message: str):
+    __slots__ = ("pattern", "_match")
+    
+    def __init__(self, field: str, pattern: str, message: str,
+                 compiled: Optional[re.Pattern] = None, use_re2: bool = False):
         super().__init__(field, message)
-        self.pattern = re.compile(pattern)
+        if compiled is None:
+            compiled = _WELL_KNOWN_PATTERNS.get(pattern) or _compiled(pattern, use_re2=use_re2)
+        self.pattern = compiled
+        # Bound once so validate() skips the method lookup
+        self._match = compiled.match
     
     def validate(self, data: Dict[str, Any]) -> Optional[str]:
-        if self.field in data and not self.pattern.match(str(data[self.field])):
+        if self.field in data and self._match(str(data[self.field])) is None:
             return self.message
         return None
+    
+    def compile(self) -> Callable[[Any, Dict[str, Any]], Optional[str]]:
+        if self._overrides_validate(PatternRule):
+            return ValidationRule.compile(self)
+        match, message = self._match, self.message
+        return lambda value, data: (
+            message if value is not _MISSING and match(str(value)) is None else None
+        )
 
 class CrossFieldRule(ValidationRule):
     """Rule for cross-field validation."""
+    __slots__ = ("related_field", "validation_func")
+    
     def __init__(self, field: str, related_field: str, 
                  validation_func: Callable[[Any, Any], bool], message: str):
         super().__init__(field, message)
@@ -78,6 +224,8 @@ class CrossFieldRule(ValidationRule):
 
 class CustomRule(ValidationRule):
     """Rule for custom validation logic."""
+    __slots__ = ("validation_func",)
+    
     def __init__(self, field: str, validation_func: Callable[[Any], bool], message: str):
         super().__init__(field, message)
         self.validation_func = validation_func
@@ -86,29 +234,149 @@ class CustomRule(ValidationRule):
         if self.field in data and not self.validation_func(data[self.field]):
             return self.message
         return None
+    
+    def compile(self) -> Callable[[Any, Dict[str, Any]], Optional[str]]:
+        if self._overrides_validate(CustomRule):
+            return ValidationRule.compile(self)
+        validation_func, message = self.validation_func, self.message
+        return lambda value, data: (
+            message if value is not _MISSING and not validation_func(value) else None
+        )
+
+class VectorRule(ValidationRule):
+    """Wraps a single-field rule with a column-wise NumPy form for batch validation.
+    
+    vec_fn receives the field's values for every record containing the field and
+    returns a boolean mask that is True where the value is valid.
+    """
+    __slots__ = ("rule", "vec_fn")
+    
+    def __init__(self, rule: ValidationRule, vec_fn: Callable[["np.ndarray"], "np.ndarray"]):
+        super().__init__(rule.field, rule.message)
+        self.rule = rule
+        self.vec_fn = vec_fn
+    
+    def validate(self, data: Dict[str, Any]) -> Optional[str]:
+        return self.rule.validate(data)
+    
+    def compile(self) -> Callable[[Any, Dict[str, Any]], Optional[str]]:
+        if self._overrides_validate(VectorRule):
+            return ValidationRule.compile(self)
+        return self.rule.compile()
+
+def _generate_validator(
+    fields: List[Tuple[str, List[ValidationRule]]]
+) -> Callable[[Dict[str, Any], DefaultDict[str, List[str]]], None]:
+    """Generate and compile one flat function running every field rule inline.
+    
+    Built-in rules (and subclasses that keep their validate) become inline
+    checks on the field value; any other rule is called through its compiled
+    check, which honours validate overrides. Field names, messages and bounds are
+    bound as globals of the generated code rather than embedded as literals.
+    """
+    namespace: Dict[str, Any] = {"_MISSING": _MISSING}
+    lines = ["def _fast_validate(data, errors):", "    get = data.get"]
+    for j, (field, rules) in enumerate(fields):
+        namespace[f"f{j}"] = field
+        lines.append(f"    v = get(f{j}, _MISSING)")
+        for i, rule in enumerate(rules):
+            key = f"{j}_{i}"
+            kind = next(
+                (base for base in (RequiredRule, TypeRule, RangeRule, PatternRule)
+                 if isinstance(rule, base) and not rule._overrides_validate(base)),
+                None
+            )
+            if rule.field != field or not rule.message or kind is None:
+                # Rules reading another field, or without a built-in inline form
+                check = rule.compile() if rule.field == field else ValidationRule.compile(rule)
+                namespace[f"c{key}"] = check
+                lines.append(f"    e = c{key}(v, data)")
+                lines.append(f"    if e: errors[f{j}].append(e)")
+                continue
+            namespace[f"m{key}"] = rule.message
+            if kind is RequiredRule:
+                condition = "v is _MISSING or v is None"
+            elif kind is TypeRule:
+                namespace[f"t{key}"] = rule.expected_type
+                condition = f"v is not _MISSING and not isinstance(v, t{key})"
+            elif kind is RangeRule:
+                namespace[f"lo{key}"], namespace[f"hi{key}"] = rule.min_val, rule.max_val
+                condition = (f"v is not _MISSING and not "
+                             f"(isinstance(v, (int, float)) and lo{key} <= v <= hi{key})")
+            else:
+                namespace[f"match{key}"] = rule._match
+                condition = f"v is not _MISSING and match{key}(str(v)) is None"
+            lines.append(f"    if {condition}: errors[f{j}].append(m{key})")
+    exec(compile("\n".join(lines), "<validation rules>", "exec"), namespace)
+    return namespace["_fast_validate"]
 
 class EnhancedValidator:
     """Enhanced validation framework with ML-based error detection."""
     
-    def __init__(self, ml_engine: Optional[EnhancedMLEngine] = None):
-        self.rules = {}
+    # Relative cost of each rule type; cheaper checks run first within a field
+    _COST = {
+        RequiredRule: 0,
+        TypeRule: 1,
+        RangeRule: 2,
+        CustomRule: 3,
+        VectorRule: 3,
+        PatternRule: 4,
+        CrossFieldRule: 5
+    }
+    
+    # Parsed rules configurations shared by all instances, keyed by file path
+    _RULES_CACHE: Dict[Path, Dict[str, Any]] = {}
+    
+    def __init__(self, ml_engine: Optional["EnhancedMLEngine"] = None, parallel: bool = False,
+                 fail_fast: bool = False):
+        """Create a validator.
+        
+        parallel=True fans field validation out to a thread pool for large
+        schemas. Only enable it for I/O-bound or GIL-releasing custom rules:
+        the built-in rules are pure Python and run much faster serially.
+        Call close() to shut the pool down.
+        """
+        # Field -> rules; tuples so the compiled checks can't go stale behind add_rule's back
+        self._rules: Dict[str, Tuple[ValidationRule, ...]] = {}
+        self.parallel = parallel
+        self.fail_fast = fail_fast
+        # Per-field compiled checks, rebuilt lazily whenever rules change
+        self._compiled: Optional[List[Tuple[str, List[Callable[[Any, Dict[str, Any]], Optional[str]]]]]] = None
+        # Batch-mode counterparts: scalar checks without vector rules, plus the vector rules
+        self._compiled_batch: Optional[List[Tuple[str, List[Callable[[Any, Dict[str, Any]], Optional[str]]]]]] = None
+        self._vector_rules: List[VectorRule] = []
+        # Generated flat validators for the serial path, one per compiled rule set
+        self._fast_validate: Optional[Callable[[Dict[str, Any], DefaultDict[str, List[str]]], None]] = None
+        self._fast_validate_batch: Optional[Callable[[Dict[str, Any], DefaultDict[str, List[str]]], None]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.cross_field_rules = []
         self.ml_engine = ml_engine
-        self.error_patterns = {}
+        self.error_patterns = defaultdict(list)
+        # Historical values per field and their cached (mean, std) statistics
+        self._history: Dict[str, List[Any]] = {}
+        self._historical_cache: Dict[str, List[Any]] = {}
+        self._field_stats: Dict[str, Tuple[float, float]] = {}
+        self._length_stats: Dict[str, Optional[Tuple[float, float]]] = {}
+        # Bounded windows of integer nanosecond timings with running sums for O(1) averages
         self.performance_metrics = {
-            "validation_time": [],
-            "error_detection_time": [],
-            "recovery_time": []
+            key: deque(maxlen=METRICS_WINDOW)
+            for key in ("validation_time", "error_detection_time", "recovery_time")
         }
+        self._perf_sum = {key: 0 for key in self.performance_metrics}
         self._load_validation_rules()
     
     def _load_validation_rules(self) -> None:
         """Load validation rules from configuration."""
         rules_path = Path(__file__).parent / "validation_rules.json"
-        if rules_path.exists():
-            with open(rules_path, "r") as f:
-                rules_config = json.load(f)
-                self._configure_rules(rules_config)
+        rules_config = self._RULES_CACHE.get(rules_path)
+        if rules_config is None:
+            if not rules_path.exists():
+                return
+            with open(rules_path, "rb") as f:
+                data = f.read()
+            rules_config = orjson.loads(data) if orjson is not None else json.loads(data)
+            self._RULES_CACHE[rules_path] = rules_config
+        self._configure_rules(rules_config)
     
     def _configure_rules(self, config: Dict[str, Any]) -> None:
         """Configure validation rules from configuration."""
@@ -122,11 +390,15 @@ class EnhancedValidator:
                 ))
             
             if "type" in rules:
-                field_rules.append(TypeRule(
-                    field,
-                    eval(rules["type"]),
-                    rules.get("type_message", f"{field} must be of type {rules['type']}")
-                ))
+                expected_type = _TYPE_REGISTRY.get(rules["type"])
+                if expected_type is None:
+                    logger.error(f"Unknown type '{rules['type']}' in validation rules for {field}")
+                else:
+                    field_rules.append(TypeRule(
+                        field,
+                        expected_type,
+                        rules.get("type_message", f"{field} must be of type {rules['type']}")
+                    ))
             
             if "range" in rules:
                 field_rules.append(RangeRule(
@@ -140,16 +412,58 @@ class EnhancedValidator:
                 field_rules.append(PatternRule(
                     field,
                     rules["pattern"],
-                    rules.get("pattern_message", f"{field} must match pattern {rules['pattern']}")
+                    rules.get("pattern_message", f"{field} must match pattern {rules['pattern']}"),
+                    compiled=_WELL_KNOWN_PATTERNS.get(rules["pattern"]),
+                    use_re2=rules.get("pattern_engine") == "re2"
                 ))
             
-            self.rules[field] = field_rules
+            self._rules[field] = tuple(field_rules)
+        self._compiled = None
+    
+    @property
+    def rules(self) -> "MappingProxyType[str, Tuple[ValidationRule, ...]]":
+        """Read-only view of the field rules; change them through add_rule."""
+        return MappingProxyType(self._rules)
     
-    def add_rule(self, field: str, rule: ValidationRule) -> None:
-        """Add a validation rule."""
-        if field not in self.rules:
-            self.rules[field] = []
-        self.rules[field].append(rule)
+    def add_rule(self, field: str, rule: ValidationRule,
+                 vectorized_fn: Optional[Callable[["np.ndarray"], "np.ndarray"]] = None) -> None:
+        """Add a validation rule, optionally with a column-wise form used by validate_batch."""
+        if vectorized_fn is not None:
+            rule = VectorRule(rule, vectorized_fn)
+        self._rules[field] = self._rules.get(field, ()) + (rule,)
+        self._compiled = None
+    
+    def _compile_rules(self) -> None:
+        """Flatten field rules into (field, checks) pairs of compiled closures, cheapest first."""
+        compiled = []
+        compiled_batch = []
+        vector_rules = []
+        ordered = []
+        ordered_batch = []
+        for field, rules in self._rules.items():
+            checks = []
+            batch_checks = []
+            field_rules = sorted(rules, key=lambda r: self._COST.get(type(r), 3))
+            ordered.append((field, field_rules))
+            ordered_batch.append((field, [r for r in field_rules if not isinstance(r, VectorRule)]))
+            for rule in field_rules:
+                if rule.field == field:
+                    check = rule.compile()
+                else:
+                    # Rule reads a different field than it is registered under
+                    check = ValidationRule.compile(rule)
+                checks.append(check)
+                if isinstance(rule, VectorRule):
+                    vector_rules.append(rule)
+                else:
+                    batch_checks.append(check)
+            compiled.append((field, checks))
+            compiled_batch.append((field, batch_checks))
+        self._compiled = compiled
+        self._compiled_batch = compiled_batch
+        self._vector_rules = vector_rules
+        self._fast_validate = _generate_validator(ordered)
+        self._fast_validate_batch = _generate_validator(ordered_batch)
     
     def add_cross_field_rule(self, rule: CrossFieldRule) -> None:
         """Add a cross-field validation rule."""
@@ -157,47 +471,124 @@ class EnhancedValidator:
     
     def validate(self, data: Dict[str, Any]) -> Dict[str, List[str]]:
         """Validate data against all rules."""
-        import time
-        start_time = time.time()
-        
-        errors = {}
+        start_ns = time.perf_counter_ns()
         
-        # Field-specific validation
-        for field, rules in self.rules.items():
-            field_errors = []
-            for rule in rules:
-                error = rule.validate(data)
-                if error:
-                    field_errors.append(error)
-            if field_errors:
-                errors[field] = field_errors
-        
-        # Cross-field validation
-        for rule in self.cross_field_rules:
-            error = rule.validate(data)
-            if error:
-                if rule.field not in errors:
-                    errors[rule.field] = []
-                errors[rule.field].append(error)
+        errors = self._validate_rules(data)
         
         # ML-based error detection
         if self.ml_engine:
             ml_errors = self._detect_ml_errors(data)
             for field, error_msgs in ml_errors.items():
-                if field not in errors:
-                    errors[field] = []
                 errors[field].extend(error_msgs)
         
         # Update performance metrics
-        validation_time = time.time() - start_time
-        self.performance_metrics["validation_time"].append(validation_time)
+        self._observe("validation_time", time.perf_counter_ns() - start_ns)
+        
+        return dict(errors)
+    
+    def validate_batch(self, records: List[Dict[str, Any]]) -> List[Dict[str, List[str]]]:
+        """Validate many records, running ML anomaly detection as one vectorized pass."""
+        start_ns = time.perf_counter_ns()
+        
+        if self._compiled is None:
+            self._compile_rules()
+        results = [self._validate_rules(record, batch=True) for record in records]
+        
+        # Vectorized rules run once per column over every record holding the field
+        if self._vector_rules:
+            import numpy as np
+        for rule in self._vector_rules:
+            indices = [i for i, record in enumerate(records) if rule.field in record]
+            if not indices:
+                continue
+            column = np.array([records[i][rule.field] for i in indices])
+            valid = np.asarray(rule.vec_fn(column), dtype=bool)
+            for position in np.flatnonzero(~valid):
+                results[indices[position]][rule.field].append(rule.message)
+        
+        # ML-based error detection across the whole batch
+        if self.ml_engine and records:
+            ml_results = self._detect_ml_errors_batch(records)
+            for errors, ml_errors in zip(results, ml_results):
+                for field, error_msgs in ml_errors.items():
+                    errors[field].extend(error_msgs)
+        
+        # Update performance metrics
+        self._observe("validation_time", time.perf_counter_ns() - start_ns)
+        
+        return [dict(errors) for errors in results]
+    
+    def _validate_rules(self, data: Dict[str, Any], batch: bool = False) -> DefaultDict[str, List[str]]:
+        """Run field-specific and cross-field rules against one record.
+        
+        With batch=True vector rules are skipped; validate_batch runs them column-wise.
+        """
+        errors = defaultdict(list)
+        
+        if self._compiled is None:
+            self._compile_rules()
+        compiled = self._compiled_batch if batch else self._compiled
+        
+        # Field-specific validation (fanned out across threads for large schemas when opted in)
+        if self.parallel and len(compiled) >= PARALLEL_MIN_FIELDS:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+            submit, validate_field = self._executor.submit, self._validate_field
+            futures = [
+                (field, submit(validate_field, field, checks, data))
+                for field, checks in compiled
+            ]
+            for field, future in futures:
+                field_errors = future.result()
+                if field_errors:
+                    errors[field] = field_errors
+        elif self.fail_fast:
+            validate_field = self._validate_field
+            for field, checks in compiled:
+                field_errors = validate_field(field, checks, data)
+                if field_errors:
+                    errors[field] = field_errors
+        else:
+            # Hot serial path: one generated function with the rules inlined
+            (self._fast_validate_batch if batch else self._fast_validate)(data, errors)
+        
+        # Cross-field validation
+        for rule in self.cross_field_rules:
+            error = rule.validate(data)
+            if error:
+                errors[rule.field].append(error)
         
         return errors
     
+    def close(self) -> None:
+        """Shut down the field-validation thread pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def __enter__(self) -> "EnhancedValidator":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def _validate_field(self, field: str,
+                        checks: List[Callable[[Any, Dict[str, Any]], Optional[str]]],
+                        data: Dict[str, Any]) -> List[str]:
+        """Run a single field's compiled checks and return its error messages."""
+        value = data.get(field, _MISSING)
+        if self.fail_fast:
+            # Stop at the first failing rule for this field
+            for check in checks:
+                error = check(value, data)
+                if error:
+                    return [error]
+            return []
+        return [error for check in checks if (error := check(value, data))]
+    
     def _detect_ml_errors(self, data: Dict[str, Any]) -> Dict[str, List[str]]:
         """Detect errors using ML-based pattern recognition."""
-        import time
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         errors = {}
         
@@ -221,35 +612,146 @@ class EnhancedValidator:
             logger.error(f"Error in ML-based error detection: {str(e)}")
         
         # Update performance metrics
-        detection_time = time.time() - start_time
-        self.performance_metrics["error_detection_time"].append(detection_time)
+        self._observe("error_detection_time", time.perf_counter_ns() - start_ns)
         
         return errors
     
+    def _detect_ml_errors_batch(self, records: List[Dict[str, Any]]) -> List[DefaultDict[str, List[str]]]:
+        """Detect statistical anomalies for a batch of records with vectorized z-scores."""
+        import numpy as np
+        
+        start_ns = time.perf_counter_ns()
+        
+        results: List[DefaultDict[str, List[str]]] = [defaultdict(list) for _ in records]
+        
+        try:
+            numeric_fields = list(dict.fromkeys(
+                field for record in records for field, value in record.items()
+                if isinstance(value, (int, float))
+            ))
+            text_fields = list(dict.fromkeys(
+                field for record in records for field, value in record.items()
+                if isinstance(value, str) and self._get_length_stats(field) is not None
+            ))
+            
+            if numeric_fields:
+                # Records x fields matrix; non-numeric or missing entries are NaN and never flag
+                X = np.array([
+                    [value if isinstance(value := record.get(field), (int, float)) else np.nan
+                     for field in numeric_fields]
+                    for record in records
+                ], dtype=np.float64)
+                stats = np.array([self._get_field_stats(field) for field in numeric_fields])
+                self._flag_anomalies(results, X, stats, numeric_fields, "statistical_outlier")
+            
+            if text_fields:
+                L = np.array([
+                    [len(value) if isinstance(value := record.get(field), str) else np.nan
+                     for field in text_fields]
+                    for record in records
+                ], dtype=np.float64)
+                stats = np.array([self._get_length_stats(field) for field in text_fields])
+                self._flag_anomalies(results, L, stats, text_fields, "unusual_length")
+            
+            for errors in results:
+                self._update_error_patterns(errors)
+            
+        except Exception as e:
+            logger.error(f"Error in ML-based error detection: {str(e)}")
+        
+        # Update performance metrics
+        self._observe("error_detection_time", time.perf_counter_ns() - start_ns)
+        
+        return results
+    
+    def _flag_anomalies(self, results: List[DefaultDict[str, List[str]]], values: "np.ndarray",
+                        stats: "np.ndarray", fields: List[str], anomaly: str) -> None:
+        """Append an anomaly message wherever |z| > 3 in a records x fields matrix."""
+        import numpy as np
+        
+        means, stds = stats[:, 0], stats[:, 1]
+        with np.errstate(invalid="ignore"):
+            mask = np.abs((values - means) / np.maximum(stds, 1e-6)) > 3
+        for row, col in np.argwhere(mask):
+            field = fields[col]
+            results[row][field].append(
+                self._generate_user_friendly_message(field, anomaly)
+            )
+    
     def _analyze_data_patterns(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze patterns in input data."""
         patterns = {}
         
         for field, value in data.items():
             if isinstance(value, (int, float)):
+                mean, std = self._get_field_stats(field)
                 patterns[field] = {
                     "type": "numeric",
-                    "mean": np.mean(self._get_historical_values(field)),
-                    "std": np.std(self._get_historical_values(field))
+                    "mean": mean,
+                    "std": std
                 }
             elif isinstance(value, str):
-                patterns[field] = {
-                    "type": "text",
-                    "length_mean": np.mean([len(v) for v in self._get_historical_values(field)]),
-                    "length_std": np.std([len(v) for v in self._get_historical_values(field)])
-                }
+                length_stats = self._get_length_stats(field)
+                if length_stats is not None:
+                    patterns[field] = {
+                        "type": "text",
+                        "length_mean": length_stats[0],
+                        "length_std": length_stats[1]
+                    }
         
         return patterns
     
+    def update_history(self, field: str, values: List[Any]) -> None:
+        """Replace the historical values for a field and drop its cached statistics."""
+        self._history[field] = list(values)
+        self.invalidate_history(field)
+    
+    def invalidate_history(self, field: Optional[str] = None) -> None:
+        """Drop cached historical values and statistics for one field, or all fields."""
+        if field is None:
+            self._historical_cache.clear()
+            self._field_stats.clear()
+            self._length_stats.clear()
+        else:
+            self._historical_cache.pop(field, None)
+            self._field_stats.pop(field, None)
+            self._length_stats.pop(field, None)
+    
+    def _get_field_stats(self, field: str) -> Tuple[float, float]:
+        """Get (mean, std) of a field's historical values, computed once per history update."""
+        stats = self._field_stats.get(field)
+        if stats is None:
+            import numpy as np
+            values = np.asarray(self._get_historical_values(field), dtype=np.float64)
+            stats = (float(values.mean()), float(values.std()))
+            self._field_stats[field] = stats
+        return stats
+    
+    def _get_length_stats(self, field: str) -> Optional[Tuple[float, float]]:
+        """Get (mean, std) of historical text lengths, or None without text history."""
+        if field not in self._length_stats:
+            import numpy as np
+            lengths = np.fromiter(
+                (len(v) for v in self._get_historical_values(field) if isinstance(v, str)),
+                dtype=np.int32
+            )
+            self._length_stats[field] = (
+                (float(lengths.mean()), float(lengths.std())) if lengths.size else None
+            )
+        return self._length_stats[field]
+    
     def _get_historical_values(self, field: str) -> List[Any]:
-        """Get historical values for a field."""
+        """Get historical values for a field, cached until invalidate_history()."""
+        values = self._historical_cache.get(field)
+        if values is None:
+            values = self._load_historical_values(field)
+            self._historical_cache[field] = values
+        return values
+    
+    def _load_historical_values(self, field: str) -> List[Any]:
+        """Load historical values for a field."""
         # This would typically come from a database
-        return [0]  # Placeholder
+        return self._history.get(field, [0])  # Placeholder
     
     def _detect_anomalies(self, field: str, value: Any, 
                          patterns: Dict[str, Any]) -> List[str]:
@@ -261,14 +763,12 @@ class EnhancedValidator:
             
             if pattern["type"] == "numeric":
                 if isinstance(value, (int, float)):
-                    z_score = abs(value - pattern["mean"]) / max(pattern["std"], 1e-6)
-                    if z_score > 3:  # More than 3 standard deviations
+                    if _zscore_exceeds(float(value), pattern["mean"], pattern["std"]):
                         anomalies.append("statistical_outlier")
             
             elif pattern["type"] == "text":
                 if isinstance(value, str):
-                    length_z_score = abs(len(value) - pattern["length_mean"]) / max(pattern["length_std"], 1e-6)
-                    if length_z_score > 3:
+                    if _zscore_exceeds(float(len(value)), pattern["length_mean"], pattern["length_std"]):
                         anomalies.append("unusual_length")
         
         return anomalies
@@ -281,32 +781,43 @@ class EnhancedValidator:
             "pattern_mismatch": f"The format of {field} doesn't match what we usually see"
         }
         
-        return messages.get(anomaly, f"There might be an issue with {field}")
+        return sys.intern(messages.get(anomaly, f"There might be an issue with {field}"))
     
     def _update_error_patterns(self, errors: Dict[str, List[str]]) -> None:
         """Update error pattern history."""
         for field, messages in errors.items():
-            if field not in self.error_patterns:
-                self.error_patterns[field] = []
-            self.error_patterns[field].extend(messages)
+            # Messages are interned, so duplicates within one update collapse cheaply
+            self.error_patterns[field].extend(dict.fromkeys(messages))
+    
+    def _observe(self, key: str, elapsed_ns: int) -> None:
+        """Record a timing, keeping the running sum in step with the bounded window."""
+        window = self.performance_metrics[key]
+        if len(window) == window.maxlen:
+            self._perf_sum[key] -= window[0]
+        window.append(elapsed_ns)
+        self._perf_sum[key] += elapsed_ns
+    
+    def _average(self, key: str) -> float:
+        """Average in seconds of the timings currently in a metric's window."""
+        return self._perf_sum[key] / max(len(self.performance_metrics[key]), 1) / 1e9
     
     def get_performance_metrics(self) -> Dict[str, float]:
         """Get validation performance metrics."""
         return {
-            "avg_validation_time": np.mean(self.performance_metrics["validation_time"]),
-            "avg_error_detection_time": np.mean(self.performance_metrics["error_detection_time"]),
-            "avg_recovery_time": np.mean(self.performance_metrics["recovery_time"])
+            "avg_validation_time": self._average("validation_time"),
+            "avg_error_detection_time": self._average("error_detection_time"),
+            "avg_recovery_time": self._average("recovery_time")
         }
     
     def suggest_corrections(self, field: str, value: Any) -> List[str]:
         """Suggest corrections for invalid values."""
         suggestions = []
         
-        if field in self.rules:
-            for rule in self.rules[field]:
+        if field in self._rules:
+            for rule in self._rules[field]:
                 if isinstance(rule, PatternRule) and isinstance(value, str):
                     # Suggest corrections for pattern mismatches
-                    if not rule.pattern.match(value):
+                    if rule._match(value) is None:
                         suggestions.extend(self._generate_pattern_suggestions(value, rule.pattern))
                 elif isinstance(rule, RangeRule) and isinstance(value, (int, float)):
                     # Suggest corrections for out-of-range values
@@ -321,12 +832,12 @@ class EnhancedValidator:
         """Generate suggestions for pattern mismatches."""
         suggestions = []
         
-        # Common patterns and their suggestions
-        if pattern.pattern == r'^\d{4}-\d{2}-\d{2}$':  # Date pattern
+        # Common patterns and their suggestions (shared singletons, compared by identity)
+        if pattern is DATE_RE:
             suggestions.append("Use YYYY-MM-DD format (e.g., 2024-02-15)")
-        elif pattern.pattern == r'^\d{2}:\d{2}(:\d{2})?$':  # Time pattern
+        elif pattern is TIME_RE:
             suggestions.append("Use HH:MM or HH:MM:SS format (e.g., 14:30 or 14:30:00)")
-        elif pattern.pattern == r'^[-+]?\d*\.?\d+$':  # Number pattern
+        elif pattern is NUMBER_RE:
             suggestions.append("Enter a valid number (e.g., 123 or 123.45)")
         
         return suggestions 
\ No newline at end of file
@@ -1,6 +1,253 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Final, Mapping, Sequence, Tuple, Union
+from dataclasses import dataclass, field
+from types import MappingProxyType
 import numpy as np
 
+# Static lookup tables, built once and shared by every engine instance
+_PLANETARY_TEXT: Final[Mapping[str, str]] = MappingProxyType({
+    'Sun': 'Did you experience significant recognition or authority changes?',
+    'Moon': 'Were there notable emotional or domestic changes?',
+    'Mars': 'Did you face any significant challenges or conflicts?',
+    'Mercury': 'Were there important communications or educational developments?',
+    'Jupiter': 'Did you experience expansion in knowledge or opportunities?',
+    'Venus': 'Were there significant relationships or artistic developments?',
+    'Saturn': 'Did you face major responsibilities or restrictions?',
+    'Rahu': 'Were there unexpected changes or new directions?',
+    'Ketu': 'Did you experience spiritual or transformative events?'
+})
+
+_PLANETARY_WEIGHT: Final[Mapping[str, float]] = MappingProxyType({
+    'Sun': 0.9,
+    'Moon': 0.9,
+    'Mars': 0.7,
+    'Mercury': 0.6,
+    'Jupiter': 0.8,
+    'Venus': 0.7,
+    'Saturn': 0.8,
+    'Rahu': 0.6,
+    'Ketu': 0.6
+})
+
+_CHART_QUESTIONS: Final[Mapping[str, str]] = MappingProxyType({
+    'D1': 'What best describes your overall personality and life direction?',
+    'D9': 'What best describes your spiritual inclinations and dharma?',
+    'D10': 'What best describes your career and professional life?'
+})
+
+_CHART_WEIGHTS: Final[Mapping[str, float]] = MappingProxyType({
+    'D1': 1.0,  # Rashi (Main chart)
+    'D9': 0.9,  # Navamsa (Marriage, dharma)
+    'D10': 0.8, # Dasamsa (Career)
+    'D7': 0.7,  # Saptamsa (Children)
+    'D2': 0.6,  # Hora (Wealth)
+    'D3': 0.5   # Drekkana (Siblings)
+})
+
+_SIGN_TRAITS: Final[Mapping[int, Mapping[str, str]]] = MappingProxyType({
+    0: {'nature': 'fiery', 'traits': 'dynamic and assertive'},
+    1: {'nature': 'earthy', 'traits': 'practical and stable'},
+    2: {'nature': 'airy', 'traits': 'intellectual and social'},
+    3: {'nature': 'watery', 'traits': 'emotional and intuitive'},
+    4: {'nature': 'fiery', 'traits': 'creative and confident'},
+    5: {'nature': 'earthy', 'traits': 'analytical and detail-oriented'},
+    6: {'nature': 'airy', 'traits': 'harmonious and diplomatic'},
+    7: {'nature': 'watery', 'traits': 'intense and transformative'},
+    8: {'nature': 'fiery', 'traits': 'philosophical and adventurous'},
+    9: {'nature': 'earthy', 'traits': 'ambitious and disciplined'},
+    10: {'nature': 'airy', 'traits': 'innovative and humanitarian'},
+    11: {'nature': 'watery', 'traits': 'compassionate and artistic'}
+})
+
+_TRAIT_DESCRIPTIONS: Final[Mapping[str, Mapping[int, str]]] = MappingProxyType({
+    'psychological': {
+        0: 'Independent and pioneering',
+        1: 'Patient and reliable',
+        2: 'Versatile and curious',
+        3: 'Nurturing and protective',
+        4: 'Confident and expressive',
+        5: 'Analytical and perfectionist',
+        6: 'Diplomatic and cooperative',
+        7: 'Intense and resourceful',
+        8: 'Optimistic and adventurous',
+        9: 'Ambitious and responsible',
+        10: 'Original and humanitarian',
+        11: 'Compassionate and adaptable'
+    },
+    'appearance': {
+        0: 'Athletic build with strong features',
+        1: 'Solid build with steady gaze',
+        2: 'Tall with quick movements',
+        3: 'Round features with gentle expression',
+        4: 'Dramatic presence with proud bearing',
+        5: 'Neat appearance with precise movements',
+        6: 'Graceful with balanced features',
+        7: 'Magnetic presence with penetrating gaze',
+        8: 'Tall with jovial expression',
+        9: 'Distinguished with reserved manner',
+        10: 'Unique style with friendly expression',
+        11: 'Gentle appearance with dreamy expression'
+    },
+    'interests': {
+        0: 'Sports and leadership',
+        1: 'Nature and crafts',
+        2: 'Communication and learning',
+        3: 'Family and emotional well-being',
+        4: 'Arts and entertainment',
+        5: 'Health and organization',
+        6: 'Relationships and aesthetics',
+        7: 'Research and mysteries',
+        8: 'Philosophy and travel',
+        9: 'Career and structure',
+        10: 'Technology and groups',
+        11: 'Spirituality and creativity'
+    },
+    'values': {
+        0: 'Independence and courage',
+        1: 'Security and loyalty',
+        2: 'Knowledge and adaptability',
+        3: 'Family and emotional security',
+        4: 'Creativity and recognition',
+        5: 'Efficiency and improvement',
+        6: 'Harmony and fairness',
+        7: 'Truth and transformation',
+        8: 'Freedom and wisdom',
+        9: 'Achievement and tradition',
+        10: 'Progress and equality',
+        11: 'Unity and compassion'
+    }
+})
+
+# Every (from, to) sign pair and (trait type, current, potential) ascendant triple, resolved at import.
+# Combinations are plain dicts (JSON-serializable), handed out as copies
+_SIGN_COMBINATIONS: Final[Mapping[Tuple[int, int], Tuple[Dict[str, str], ...]]] = MappingProxyType({
+    (from_sign, to_sign): (
+        {
+            'id': f"combination_{from_sign}_{to_sign}",
+            'description': f"Primarily {_SIGN_TRAITS[from_sign]['traits']}, with some {_SIGN_TRAITS[to_sign]['traits']} qualities"
+        },
+        {
+            'id': f"combination_{to_sign}_{from_sign}",
+            'description': f"Primarily {_SIGN_TRAITS[to_sign]['traits']}, with some {_SIGN_TRAITS[from_sign]['traits']} qualities"
+        }
+    )
+    for from_sign in range(12) for to_sign in range(12)
+})
+
+_ASCENDANT_TRAITS: Final[Mapping[Tuple[str, int, int], str]] = MappingProxyType({
+    (trait_type, current_sign, potential_sign): f"{descriptions[current_sign]} or {descriptions[potential_sign]}"
+    for trait_type, descriptions in _TRAIT_DESCRIPTIONS.items()
+    for current_sign in range(12) for potential_sign in range(12)
+})
+
+# Option lists used to build generated questions; plain dicts in tuples so they
+# stay JSON-serializable. Questions get copies (see _copy_options)
+_YES_NO_OPTIONS: Final[Tuple[Dict[str, str], ...]] = (
+    {'value': 'yes', 'label': 'Yes'},
+    {'value': 'no', 'label': 'No'}
+)
+
+_TIMEFRAME_OPTIONS: Final[Tuple[Dict[str, str], ...]] = (
+    {'value': 'childhood', 'label': 'During childhood (0-12 years)'},
+    {'value': 'teenage', 'label': 'During teenage years (13-19)'},
+    {'value': 'early_adult', 'label': 'Early adulthood (20-28)'},
+    {'value': 'adult', 'label': 'Adulthood (29-45)'},
+    {'value': 'middle_age', 'label': 'Middle age (46-60)'},
+    {'value': 'senior', 'label': 'Senior years (60+)'}
+)
+
+_DASHA_EVENT_OPTIONS: Final[Tuple[Dict[str, str], ...]] = (
+    {'value': 'career', 'label': 'Career Changes'},
+    {'value': 'relationship', 'label': 'Relationship Events'},
+    {'value': 'education', 'label': 'Educational Milestones'},
+    {'value': 'health', 'label': 'Health Issues'},
+    {'value': 'residence', 'label': 'Residence Changes'},
+    {'value': 'spiritual', 'label': 'Spiritual Events'}
+)
+
+_DIVISIONAL_DEFAULT_OPTIONS: Final[Tuple[Dict[str, str], ...]] = (
+    {'value': 'positive', 'label': 'Mostly positive experiences'},
+    {'value': 'mixed', 'label': 'Mixed experiences'},
+    {'value': 'challenging', 'label': 'Mostly challenging experiences'},
+    {'value': 'transformative', 'label': 'Transformative experiences'}
+)
+
+_DIVISIONAL_CHART_OPTIONS: Final[Mapping[str, Tuple[Dict[str, str], ...]]] = MappingProxyType({
+    'D1': (
+        {'value': 'leadership', 'label': 'Natural leader and independent'},
+        {'value': 'support', 'label': 'Supportive and nurturing'},
+        {'value': 'creative', 'label': 'Creative and expressive'},
+        {'value': 'analytical', 'label': 'Analytical and methodical'}
+    ),
+    'D9': (
+        {'value': 'dharmic', 'label': 'Strong sense of purpose and dharma'},
+        {'value': 'seeking', 'label': 'Spiritual seeker'},
+        {'value': 'practical', 'label': 'Practical spirituality'},
+        {'value': 'devotional', 'label': 'Devotional nature'}
+    ),
+    'D10': (
+        {'value': 'entrepreneur', 'label': 'Entrepreneurial spirit'},
+        {'value': 'professional', 'label': 'Professional excellence'},
+        {'value': 'service', 'label': 'Service-oriented career'},
+        {'value': 'creative', 'label': 'Creative profession'}
+    )
+})
+
+def _copy_options(options: Sequence[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Fresh list of option dicts, so a question's consumer can't alter the shared constants."""
+    return [dict(option) for option in options]
+
+def _planetary_follow_up() -> Dict[str, Any]:
+    """Follow-up asking when a planetary event occurred, built fresh for each question."""
+    return {
+        'condition': 'yes',
+        'question': {
+            'type': 'select',
+            'text': 'When did this occur?',
+            'options': _copy_options(_TIMEFRAME_OPTIONS)
+        }
+    }
+
+def _batch_sign_changes(lons: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find longitudes near a sign boundary, for a whole array at once.
+    
+    Returns a mask of longitudes within 2 degrees of a sign boundary together
+    with the current and next sign of every entry. NaN (unknown) longitudes
+    are never in the mask.
+    """
+    signs = (lons / 30).astype(np.int64)
+    remainders = lons % 30
+    mask = (remainders < 2) | (remainders > 28)
+    return mask, signs, (signs + 1) % 12
+
+def _longitude(position: Any) -> float:
+    """A position's longitude, or NaN when it has none."""
+    longitude = position.get('longitude') if isinstance(position, Mapping) else None
+    return float('nan') if longitude is None else longitude
+
+@dataclass(frozen=True)
+class PositionsSoA:
+    """Planet longitudes as one array with a parallel planet-name index."""
+    planets: Tuple[str, ...]
+    longitudes: np.ndarray
+    index: Mapping[str, int] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'index', {planet: i for i, planet in enumerate(self.planets)})
+    
+    @classmethod
+    def from_positions(cls, positions: Union[Dict[str, Any], 'PositionsSoA']) -> 'PositionsSoA':
+        """Convert a planet -> {'longitude': ...} mapping once; SoA input is returned as-is.
+        
+        Positions without a longitude are stored as NaN.
+        """
+        if isinstance(positions, cls):
+            return positions
+        return cls(
+            tuple(positions),
+            np.fromiter((_longitude(position) for position in positions.values()),
+                        dtype=np.float64, count=len(positions))
+        )
+
 class AnalysisEngine:
     def __init__(self):
         self.currentStep = 0
@@ -23,24 +270,21 @@ class AnalysisEngine:
 
     def _generatePlanetaryQuestions(self, positions: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate questions based on planetary positions"""
-        questions = []
+        soa = PositionsSoA.from_positions(positions)
         
         # Check for zodiac sign changes
-        sunMoonChanges = self._checkSunMoonSignChanges(positions)
-        if len(sunMoonChanges) > 0:
-            for change in sunMoonChanges:
-                questions.append({
-                    'id': f"sign_change_{change['planet']}",
-                    'type': 'select',
-                    'category': 'personality',
-                    'text': 'Select the description that best matches your nature:',
-                    'options': [{'value': combo['id'], 'label': combo['description']} 
-                              for combo in change['combinations']],
-                    'weight': 1.0
-                })
+        questions = [{
+            'id': f"sign_change_{change['planet']}",
+            'type': 'select',
+            'category': 'personality',
+            'text': 'Select the description that best matches your nature:',
+            'options': [{'value': combo['id'], 'label': combo['description']}
+                        for combo in change['combinations']],
+            'weight': 1.0
+        } for change in self._checkSunMoonSignChanges(soa)]
 
         # Check Ascendant changes
-        ascendantChanges = self._checkAscendantChanges(positions)
+        ascendantChanges = self._checkAscendantChanges(soa)
         if ascendantChanges:
             questions.append({
                 'id': 'ascendant_traits',
@@ -57,26 +301,16 @@ class AnalysisEngine:
             })
 
         # Generate event-based questions
-        for planet, position in positions.items():
-            questions.append({
-                'id': f"planetary_{planet}",
-                'type': 'boolean',
-                'category': 'life_events',
-                'text': self._getPlanetaryQuestionText(planet, position),
-                'options': [
-                    {'value': 'yes', 'label': 'Yes'},
-                    {'value': 'no', 'label': 'No'}
-                ],
-                'followUp': {
-                    'condition': 'yes',
-                    'question': {
-                        'type': 'select',
-                        'text': 'When did this occur?',
-                        'options': self._generateTimeframeOptions()
-                    }
-                },
-                'weight': self._getPlanetaryWeight(planet)
-            })
+        question_text, weight = self._getPlanetaryQuestionText, self._getPlanetaryWeight
+        questions.extend([{
+            'id': f"planetary_{planet}",
+            'type': 'boolean',
+            'category': 'life_events',
+            'text': question_text(planet, position),
+            'options': _copy_options(_YES_NO_OPTIONS),
+            'followUp': _planetary_follow_up(),
+            'weight': weight(planet)
+        } for planet, position in positions.items()])
 
         return questions
 
@@ -98,30 +332,22 @@ class AnalysisEngine:
             'type': 'multi_select',
             'category': 'life_events',
             'text': f"During {period['planet']}'s period ({period['start_date']} to {period['end_date']}), which events occurred?",
-            'options': [
-                {'value': 'career', 'label': 'Career Changes'},
-                {'value': 'relationship', 'label': 'Relationship Events'},
-                {'value': 'education', 'label': 'Educational Milestones'},
-                {'value': 'health', 'label': 'Health Issues'},
-                {'value': 'residence', 'label': 'Residence Changes'},
-                {'value': 'spiritual', 'label': 'Spiritual Events'}
-            ],
+            'options': _copy_options(_DASHA_EVENT_OPTIONS),
             'weight': period['significance']
         } for period in dasha_analysis['major_periods']]
 
-    def _checkSunMoonSignChanges(self, positions: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _checkSunMoonSignChanges(self, positions: Union[Dict[str, Any], PositionsSoA]) -> List[Dict[str, Any]]:
         """Check for Sun/Moon sign changes"""
-        changes = []
-        for planet in ['Sun', 'Moon']:
-            signChange = self._calculateSignChange(positions[planet])
-            if signChange:
-                changes.append({
-                    'planet': planet,
-                    'combinations': self._getSignCombinations(signChange['from'], signChange['to'])
-                })
-        return changes
-
-    def _checkAscendantChanges(self, positions: Dict[str, Any]) -> Dict[str, str]:
+        soa = PositionsSoA.from_positions(positions)
+        planets = ('Sun', 'Moon')
+        lons = soa.longitudes[[soa.index[planet] for planet in planets]]
+        mask, from_signs, to_signs = _batch_sign_changes(lons)
+        return [{
+            'planet': planets[i],
+            'combinations': self._getSignCombinations(int(from_signs[i]), int(to_signs[i]))
+        } for i in np.flatnonzero(mask)]
+
+    def _checkAscendantChanges(self, positions: Union[Dict[str, Any], PositionsSoA]) -> Dict[str, str]:
         """Check for Ascendant changes"""
         ascendantChange = self._calculateAscendantChange(positions)
         if not ascendantChange:
@@ -136,44 +362,15 @@ class AnalysisEngine:
 
     def _getPlanetaryQuestionText(self, planet: str, position: Dict[str, Any]) -> str:
         """Get question text for a planet"""
-        templates = {
-            'Sun': 'Did you experience significant recognition or authority changes?',
-            'Moon': 'Were there notable emotional or domestic changes?',
-            'Mars': 'Did you face any significant challenges or conflicts?',
-            'Mercury': 'Were there important communications or educational developments?',
-            'Jupiter': 'Did you experience expansion in knowledge or opportunities?',
-            'Venus': 'Were there significant relationships or artistic developments?',
-            'Saturn': 'Did you face major responsibilities or restrictions?',
-            'Rahu': 'Were there unexpected changes or new directions?',
-            'Ketu': 'Did you experience spiritual or transformative events?'
-        }
-        return templates.get(planet, 'Did you experience significant changes?')
+        return _PLANETARY_TEXT.get(planet, 'Did you experience significant changes?')
 
     def _generateTimeframeOptions(self) -> List[Dict[str, str]]:
         """Generate timeframe options"""
-        return [
-            {'value': 'childhood', 'label': 'During childhood (0-12 years)'},
-            {'value': 'teenage', 'label': 'During teenage years (13-19)'},
-            {'value': 'early_adult', 'label': 'Early adulthood (20-28)'},
-            {'value': 'adult', 'label': 'Adulthood (29-45)'},
-            {'value': 'middle_age', 'label': 'Middle age (46-60)'},
-            {'value': 'senior', 'label': 'Senior years (60+)'}
-        ]
+        return _copy_options(_TIMEFRAME_OPTIONS)
 
     def _getPlanetaryWeight(self, planet: str) -> float:
         """Get weight for a planet"""
-        weights = {
-            'Sun': 0.9,
-            'Moon': 0.9,
-            'Mars': 0.7,
-            'Mercury': 0.6,
-            'Jupiter': 0.8,
-            'Venus': 0.7,
-            'Saturn': 0.8,
-            'Rahu': 0.6,
-            'Ketu': 0.6
-        }
-        return weights.get(planet, 0.5)
+        return _PLANETARY_WEIGHT.get(planet, 0.5)
 
     def getCurrentStep(self) -> int:
         """Get current step"""
@@ -187,29 +384,13 @@ class AnalysisEngine:
         """Get rectification results"""
         return self.rectificationResults
 
-    def _calculateSignChange(self, position: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate sign change for a planet"""
-        longitude = position['longitude']
-        sign = int(longitude / 30)
-        remainder = longitude % 30
-        
-        if remainder < 2:  # Within 2 degrees of sign boundary
-            return {
-                'from': sign,
-                'to': (sign + 1) % 12
-            }
-        elif remainder > 28:  # Within 2 degrees of next sign
-            return {
-                'from': sign,
-                'to': (sign + 1) % 12
-            }
-        return {}
-
-    def _calculateAscendantChange(self, positions: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculateAscendantChange(self, positions: Union[Dict[str, Any], PositionsSoA]) -> Dict[str, Any]:
         """Calculate ascendant change"""
+        soa = PositionsSoA.from_positions(positions)
         # Check if ascendant is near a sign boundary
-        if 'Ascendant' in positions:
-            longitude = positions['Ascendant']['longitude']
+        index = soa.index.get('Ascendant')
+        if index is not None and not np.isnan(soa.longitudes[index]):
+            longitude = float(soa.longitudes[index])
             sign = int(longitude / 30)
             remainder = longitude % 30
             
@@ -222,148 +403,22 @@ class AnalysisEngine:
 
     def _getSignCombinations(self, from_sign: int, to_sign: int) -> List[Dict[str, str]]:
         """Get possible trait combinations for sign changes"""
-        sign_traits = {
-            0: {'nature': 'fiery', 'traits': 'dynamic and assertive'},
-            1: {'nature': 'earthy', 'traits': 'practical and stable'},
-            2: {'nature': 'airy', 'traits': 'intellectual and social'},
-            3: {'nature': 'watery', 'traits': 'emotional and intuitive'},
-            4: {'nature': 'fiery', 'traits': 'creative and confident'},
-            5: {'nature': 'earthy', 'traits': 'analytical and detail-oriented'},
-            6: {'nature': 'airy', 'traits': 'harmonious and diplomatic'},
-            7: {'nature': 'watery', 'traits': 'intense and transformative'},
-            8: {'nature': 'fiery', 'traits': 'philosophical and adventurous'},
-            9: {'nature': 'earthy', 'traits': 'ambitious and disciplined'},
-            10: {'nature': 'airy', 'traits': 'innovative and humanitarian'},
-            11: {'nature': 'watery', 'traits': 'compassionate and artistic'}
-        }
-        
-        return [
-            {
-                'id': f"combination_{from_sign}_{to_sign}",
-                'description': f"Primarily {sign_traits[from_sign]['traits']}, with some {sign_traits[to_sign]['traits']} qualities"
-            },
-            {
-                'id': f"combination_{to_sign}_{from_sign}",
-                'description': f"Primarily {sign_traits[to_sign]['traits']}, with some {sign_traits[from_sign]['traits']} qualities"
-            }
-        ]
+        return [dict(combination) for combination in _SIGN_COMBINATIONS[(from_sign, to_sign)]]
 
     def _getAscendantTraits(self, ascendant_change: Dict[str, Any], trait_type: str) -> str:
         """Get ascendant traits based on sign changes"""
-        trait_descriptions = {
-            'psychological': {
-                0: 'Independent and pioneering',
-                1: 'Patient and reliable',
-                2: 'Versatile and curious',
-                3: 'Nurturing and protective',
-                4: 'Confident and expressive',
-                5: 'Analytical and perfectionist',
-                6: 'Diplomatic and cooperative',
-                7: 'Intense and resourceful',
-                8: 'Optimistic and adventurous',
-                9: 'Ambitious and responsible',
-                10: 'Original and humanitarian',
-                11: 'Compassionate and adaptable'
-            },
-            'appearance': {
-                0: 'Athletic build with strong features',
-                1: 'Solid build with steady gaze',
-                2: 'Tall with quick movements',
-                3: 'Round features with gentle expression',
-                4: 'Dramatic presence with proud bearing',
-                5: 'Neat appearance with precise movements',
-                6: 'Graceful with balanced features',
-                7: 'Magnetic presence with penetrating gaze',
-                8: 'Tall with jovial expression',
-                9: 'Distinguished with reserved manner',
-                10: 'Unique style with friendly expression',
-                11: 'Gentle appearance with dreamy expression'
-            },
-            'interests': {
-                0: 'Sports and leadership',
-                1: 'Nature and crafts',
-                2: 'Communication and learning',
-                3: 'Family and emotional well-being',
-                4: 'Arts and entertainment',
-                5: 'Health and organization',
-                6: 'Relationships and aesthetics',
-                7: 'Research and mysteries',
-                8: 'Philosophy and travel',
-                9: 'Career and structure',
-                10: 'Technology and groups',
-                11: 'Spirituality and creativity'
-            },
-            'values': {
-                0: 'Independence and courage',
-                1: 'Security and loyalty',
-                2: 'Knowledge and adaptability',
-                3: 'Family and emotional security',
-                4: 'Creativity and recognition',
-                5: 'Efficiency and improvement',
-                6: 'Harmony and fairness',
-                7: 'Truth and transformation',
-                8: 'Freedom and wisdom',
-                9: 'Achievement and tradition',
-                10: 'Progress and equality',
-                11: 'Unity and compassion'
-            }
-        }
-        
-        current_sign = ascendant_change['current_sign']
-        potential_sign = ascendant_change['potential_sign']
-        
-        if trait_type in trait_descriptions:
-            return f"{trait_descriptions[trait_type][current_sign]} or {trait_descriptions[trait_type][potential_sign]}"
+        if trait_type in _TRAIT_DESCRIPTIONS:
+            return _ASCENDANT_TRAITS[(trait_type, ascendant_change['current_sign'], ascendant_change['potential_sign'])]
         return "Traits not available"
 
     def _getDivisionalChartQuestion(self, chart: str) -> str:
         """Get question text for divisional chart"""
-        chart_questions = {
-            'D1': 'What best describes your overall personality and life direction?',
-            'D9': 'What best describes your spiritual inclinations and dharma?',
-            'D10': 'What best describes your career and professional life?'
-        }
-        return chart_questions.get(chart, 'What best describes your experiences in this area?')
+        return _CHART_QUESTIONS.get(chart, 'What best describes your experiences in this area?')
 
     def _getDivisionalChartOptions(self, chart: str, data: Dict[str, Any]) -> List[Dict[str, str]]:
         """Get options for divisional chart questions"""
-        default_options = [
-            {'value': 'positive', 'label': 'Mostly positive experiences'},
-            {'value': 'mixed', 'label': 'Mixed experiences'},
-            {'value': 'challenging', 'label': 'Mostly challenging experiences'},
-            {'value': 'transformative', 'label': 'Transformative experiences'}
-        ]
-        
-        chart_options = {
-            'D1': [
-                {'value': 'leadership', 'label': 'Natural leader and independent'},
-                {'value': 'support', 'label': 'Supportive and nurturing'},
-                {'value': 'creative', 'label': 'Creative and expressive'},
-                {'value': 'analytical', 'label': 'Analytical and methodical'}
-            ],
-            'D9': [
-                {'value': 'dharmic', 'label': 'Strong sense of purpose and dharma'},
-                {'value': 'seeking', 'label': 'Spiritual seeker'},
-                {'value': 'practical', 'label': 'Practical spirituality'},
-                {'value': 'devotional', 'label': 'Devotional nature'}
-            ],
-            'D10': [
-                {'value': 'entrepreneur', 'label': 'Entrepreneurial spirit'},
-                {'value': 'professional', 'label': 'Professional excellence'},
-                {'value': 'service', 'label': 'Service-oriented career'},
-                {'value': 'creative', 'label': 'Creative profession'}
-            ]
-        }
-        return chart_options.get(chart, default_options)
+        return _copy_options(_DIVISIONAL_CHART_OPTIONS.get(chart, _DIVISIONAL_DEFAULT_OPTIONS))
 
     def _getChartWeight(self, chart: str) -> float:
         """Get weight for a divisional chart"""
-        weights = {
-            'D1': 1.0,  # Rashi (Main chart)
-            'D9': 0.9,  # Navamsa (Marriage, dharma)
-            'D10': 0.8, # Dasamsa (Career)
-            'D7': 0.7,  # Saptamsa (Children)
-            'D2': 0.6,  # Hora (Wealth)
-            'D3': 0.5   # Drekkana (Siblings)
-        }
-        return weights.get(chart, 0.1) 
\ No newline at end of file
+        return _CHART_WEIGHTS.get(chart, 0.1)
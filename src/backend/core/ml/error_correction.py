@@ -1,4 +1,14 @@
 from typing import Dict, Any, List, Optional, Tuple, Union
+import copy
+import functools
+import hashlib
+import logging
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+import joblib
 import numpy as np
 import torch
 import torch.nn as nn
@@ -8,54 +18,148 @@ from transformers import AutoModelForSequenceClassification, AutoTokenizer
 from ..utils.error_handler import ErrorHandler
 from ..models.error_data import ErrorData
 
+try:
+    # Optional JIT compiler for the numerical preprocessing kernel
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# Optional pre-fit outlier detector shared by every corrector; without it each
+# corrector fits its own on the first batch it scores
+ISOLATION_FOREST_PATH = Path(__file__).parent / "models" / "isolation_forest.joblib"
+
+# Optional offline scaler statistics: <kind>_mean and <kind>_inv_std arrays for
+# 'numerical' and 'temporal'; kinds without them are fitted on their first batch
+PREPROCESSING_STATS_PATH = Path(__file__).parent / "models" / "error_correction_preprocessing.npz"
+
+# Fixed token length of detection batches on CUDA, so captured graphs can be replayed
+DETECTION_SEQ_LEN = 128
+
+# Number of correct_errors results kept, keyed by a hash of their inputs
+CORRECTION_CACHE_SIZE = 256
+
+# Standardized numerical values are clipped to this many standard deviations
+NUMERICAL_CLIP = 5.0
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _zscore_clip_kernel(x: np.ndarray, mean: np.ndarray, inv_std: np.ndarray,
+                            lo: float, hi: float) -> np.ndarray:
+        """Standardize a samples x features matrix column-wise and clip to [lo, hi]."""
+        out = np.empty_like(x)
+        for i in prange(x.shape[0]):
+            for j in range(x.shape[1]):
+                z = (x[i, j] - mean[j]) * inv_std[j]
+                out[i, j] = min(max(z, lo), hi)
+        return out
+else:
+    def _zscore_clip_kernel(x: np.ndarray, mean: np.ndarray, inv_std: np.ndarray,
+                            lo: float, hi: float) -> np.ndarray:
+        """Standardize a samples x features matrix column-wise and clip to [lo, hi]."""
+        return np.clip((x - mean) * inv_std, lo, hi)
+
+def _zscore_clip(x: np.ndarray, mean: np.ndarray, inv_std: np.ndarray,
+                 lo: float, hi: float) -> np.ndarray:
+    """Check that the statistics match x's feature width, then run the z-score kernel.
+    
+    The numba kernel does no bounds checking, so a mismatch would read out of bounds.
+    """
+    if not (mean.shape[0] == inv_std.shape[0] == x.shape[1]):
+        raise ValueError(
+            f"Scaler statistics cover {mean.shape[0]} / {inv_std.shape[0]} features, "
+            f"data has {x.shape[1]}"
+        )
+    return _zscore_clip_kernel(x, mean, inv_std, lo, hi)
+
+@dataclass(slots=True)
+class CorrectionResult:
+    """Outcome of AutomatedErrorCorrector.correct_errors."""
+    original_data: ErrorData
+    errors: Dict[str, Any]
+    corrections: Dict[str, Any]
+    confidence: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict form for JSON/API serialization."""
+        return {
+            'original_data': self.original_data,
+            'errors': self.errors,
+            'corrections': self.corrections,
+            'confidence': self.confidence
+        }
+
+@functools.lru_cache(maxsize=None)
+def _shared_iforest(path: Path) -> IsolationForest:
+    """Load the pre-fit IsolationForest at path once per process; only fitted models are cached."""
+    return joblib.load(path)
+
+@functools.lru_cache(maxsize=None)
+def _get_tokenizer(name: str) -> AutoTokenizer:
+    """Load a HuggingFace tokenizer once per process."""
+    return AutoTokenizer.from_pretrained(name)
+
+@functools.lru_cache(maxsize=None)
+def _get_sequence_classifier(role: str, name: str, num_labels: int) -> AutoModelForSequenceClassification:
+    """Load a pretrained sequence classifier once per (role, name, num_labels).
+    
+    The role keeps models that share a checkpoint (e.g. detection and validation)
+    as separate modules, since _prepare_model casts and quantizes them in place.
+    """
+    model = AutoModelForSequenceClassification.from_pretrained(name, num_labels=num_labels)
+    model.eval()
+    return model
+
+@functools.lru_cache(maxsize=None)
+def _quantize_dynamic(model: nn.Module) -> nn.Module:
+    """int8 dynamically quantized copy of a model's Linear layers, built once per model."""
+    return torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+
 class AutomatedErrorCorrector:
     def __init__(self, config: Dict[str, Any]):
         self.error_handler = ErrorHandler()
         self.config = config
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        # LRU of correct_errors results keyed by a blake2b digest of (input_data, context)
+        self._cache: "OrderedDict[bytes, CorrectionResult]" = OrderedDict()
+        # Captured detection-model CUDA graphs keyed by input shape:
+        # (graph, static inputs, static logits)
+        self._detection_graphs: Dict[Tuple[int, ...], Tuple[Any, Dict[str, torch.Tensor], torch.Tensor]] = {}
+        # Workers for the independent per-modality detectors
+        self._pool = ThreadPoolExecutor(max_workers=self.config.get('detection_workers', 4))
         
         # Initialize components
         self._initialize_models()
         self._initialize_preprocessors()
         self._load_correction_rules()
+    
+    def close(self) -> None:
+        """Shut down the detector worker pool, waiting for running detections."""
+        self._pool.shutdown(wait=True)
         
     def correct_errors(
         self,
         input_data: ErrorData,
         context: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """Automatically detect and correct errors in the input data."""
+    ) -> CorrectionResult:
+        """Automatically detect and correct errors in the input data.
+        
+        Pipeline stages do not catch their own failures; any exception is
+        reported here and answered with the fallback results. Successful
+        results are cached; each caller gets its own deep copy, so mutating a
+        returned result never changes later answers for the same input.
+        """
+        key = self._cache_key(input_data, context)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return copy.deepcopy(cached)
+        
         try:
-            # Preprocess input data
-            processed_data = self._preprocess_data(input_data)
-            
-            # Detect errors
-            errors = self._detect_errors(processed_data, context)
-            
-            # Analyze error patterns
-            error_patterns = self._analyze_error_patterns(errors)
-            
-            # Generate corrections
-            corrections = self._generate_corrections(
-                processed_data,
-                errors,
-                error_patterns
-            )
-            
-            # Validate corrections
-            validated_corrections = self._validate_corrections(
-                corrections,
-                processed_data,
-                context
-            )
-            
-            return {
-                'original_data': input_data,
-                'errors': errors,
-                'corrections': validated_corrections,
-                'confidence': self._calculate_correction_confidence(validated_corrections)
-            }
-            
+            with torch.inference_mode():
+                result = self._run_correction(input_data, context)
         except Exception as e:
             self.error_handler.handle_error(
                 "Error correction failed",
@@ -63,21 +167,75 @@ class AutomatedErrorCorrector:
                 severity="high"
             )
             return self._get_fallback_results(input_data)
+        
+        if key is not None:
+            self._cache[key] = copy.deepcopy(result)
+            if len(self._cache) > self.config.get('correction_cache_size', CORRECTION_CACHE_SIZE):
+                self._cache.popitem(last=False)
+        return result
+    
+    def _cache_key(
+        self,
+        input_data: ErrorData,
+        context: Optional[Dict[str, Any]]
+    ) -> Optional[bytes]:
+        """Content hash of the inputs, or None when they cannot be pickled."""
+        try:
+            payload = pickle.dumps((input_data, context), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
+    def _run_correction(
+        self,
+        input_data: ErrorData,
+        context: Optional[Dict[str, Any]]
+    ) -> CorrectionResult:
+        """Run the correction pipeline; called under torch.inference_mode()."""
+        # Preprocess input data
+        processed_data = self._preprocess_data(input_data)
+        
+        # Detect errors
+        errors = self._detect_errors(processed_data, context)
+        
+        # Analyze error patterns
+        error_patterns = self._analyze_error_patterns(errors)
+        
+        # Generate corrections
+        corrections = self._generate_corrections(
+            processed_data,
+            errors,
+            error_patterns
+        )
+        
+        # Validate corrections
+        validated_corrections = self._validate_corrections(
+            corrections,
+            processed_data,
+            context
+        )
+        
+        return CorrectionResult(
+            original_data=input_data,
+            errors=errors,
+            corrections=validated_corrections,
+            confidence=self._calculate_correction_confidence(validated_corrections)
+        )
     
     def _initialize_models(self):
         """Initialize error detection and correction models."""
         try:
             # Error detection model
-            self.detection_model = self._create_detection_model()
+            self.detection_model = self._prepare_model(self._create_detection_model())
             
             # Error classification model
-            self.classification_model = self._create_classification_model()
+            self.classification_model = self._prepare_model(self._create_classification_model())
             
             # Correction generation model
-            self.correction_model = self._create_correction_model()
+            self.correction_model = self._prepare_model(self._create_correction_model())
             
             # Validation model
-            self.validation_model = self._create_validation_model()
+            self.validation_model = self._prepare_model(self._create_validation_model())
             
         except Exception as e:
             self.error_handler.handle_error(
@@ -86,57 +244,158 @@ class AutomatedErrorCorrector:
                 severity="critical"
             )
     
+    def _prepare_model(self, model: nn.Module) -> nn.Module:
+        """Put a model in eval mode on the target device: FP16 on CUDA, int8 Linear layers on CPU."""
+        model.eval()
+        model.to(self.device)
+        if self.device.type == 'cuda':
+            model.half()
+        elif self.config.get('quantize_cpu', True):
+            model = _quantize_dynamic(model)
+        return model
+    
+    def _create_detection_model(self) -> nn.Module:
+        """Binary error/no-error classifier over the input text representation."""
+        return _get_sequence_classifier('detection', self.config.get('detection_model', 'bert-base-uncased'), 2)
+    
+    def _create_classification_model(self) -> nn.Module:
+        """Classifier assigning detected errors to one of the error categories."""
+        return _get_sequence_classifier(
+            'classification',
+            self.config.get('classification_model', 'bert-base-uncased'),
+            self.config.get('num_error_classes', 4)
+        )
+    
+    def _create_validation_model(self) -> nn.Module:
+        """Binary accept/reject classifier for proposed corrections."""
+        return _get_sequence_classifier('validation', self.config.get('validation_model', 'bert-base-uncased'), 2)
+    
     def _initialize_preprocessors(self):
         """Initialize data preprocessing components."""
+        # Categories map to int32 codes; 0 is reserved for values outside the vocabulary
+        self._cat_vocab: Dict[Any, int] = {
+            value: code
+            for code, value in enumerate(self.config.get('categorical_vocabulary', ()), start=1)
+        }
+        
+        self.tokenizer = _get_tokenizer(self.config.get('tokenizer', 'bert-base-uncased'))
+        # Outlier detector, resolved on first use by _get_isolation_forest
+        self._iforest_path = Path(self.config.get('isolation_forest_path', ISOLATION_FOREST_PATH))
+        self.isolation_forest: Optional[IsolationForest] = None
+        
         self.scalers = {
             'numerical': StandardScaler(),
-            'categorical': StandardScaler(),
             'temporal': StandardScaler()
         }
         
-        self.tokenizer = AutoTokenizer.from_pretrained('bert-base-uncased')
-        self.isolation_forest = IsolationForest(contamination=0.1)
+        # (mean, 1 / std) per kind, from the offline statistics when they ship, else
+        # fitted on the kind's first batch; temporal stays float64 for epoch-scale values
+        self._scaler_stats: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._stats_path = Path(self.config.get('preprocessing_stats_path', PREPROCESSING_STATS_PATH))
+        if self._stats_path.exists():
+            with np.load(self._stats_path) as stats:
+                for kind, dtype in (('numerical', np.float32), ('temporal', np.float64)):
+                    if f"{kind}_mean" in stats:
+                        self._scaler_stats[kind] = (
+                            stats[f"{kind}_mean"].astype(dtype),
+                            stats[f"{kind}_inv_std"].astype(dtype)
+                        )
+    
+    def _get_isolation_forest(self, values: np.ndarray) -> IsolationForest:
+        """The outlier detector, loaded or fitted on first use.
+        
+        The shared pre-fit model is used when it is on disk; otherwise this
+        corrector fits its own estimator on values, with a warning.
+        """
+        if self.isolation_forest is None:
+            if self._iforest_path.exists():
+                self.isolation_forest = _shared_iforest(self._iforest_path)
+            else:
+                logger.warning(
+                    f"Pre-fit IsolationForest not found at {self._iforest_path}; "
+                    "fitting one on the first batch"
+                )
+                self.isolation_forest = IsolationForest(contamination=0.1).fit(values)
+        return self.isolation_forest
     
     def _load_correction_rules(self):
-        """Load predefined error correction rules."""
-        # Implement rule loading logic
-        pass
+        """Load predefined error correction rules from config['correction_rules']."""
+        self.correction_rules: List[Dict[str, Any]] = list(self.config.get('correction_rules', ()))
     
     def _preprocess_data(
         self,
         data: ErrorData
     ) -> Dict[str, torch.Tensor]:
         """Preprocess input data for error correction."""
-        try:
-            processed = {}
-            
-            # Numerical data preprocessing
-            if data.numerical_data is not None:
-                processed['numerical'] = self._preprocess_numerical(
-                    data.numerical_data
-                )
-            
-            # Categorical data preprocessing
-            if data.categorical_data is not None:
-                processed['categorical'] = self._preprocess_categorical(
-                    data.categorical_data
-                )
-            
-            # Temporal data preprocessing
-            if data.temporal_data is not None:
-                processed['temporal'] = self._preprocess_temporal(
-                    data.temporal_data
-                )
-            
-            return processed
-            
-        except Exception as e:
-            self.error_handler.handle_error(
-                "Data preprocessing error",
-                str(e),
-                severity="high"
+        processed = {}
+        
+        # Numerical data preprocessing
+        if data.numerical_data is not None:
+            processed['numerical'] = self._preprocess_numerical(
+                data.numerical_data
             )
-            return {}
+        
+        # Categorical data preprocessing
+        if data.categorical_data is not None:
+            processed['categorical'] = self._preprocess_categorical(
+                data.categorical_data
+            )
+        
+        # Temporal data preprocessing
+        if data.temporal_data is not None:
+            processed['temporal'] = self._preprocess_temporal(
+                data.temporal_data
+            )
+        
+        return processed
+    
+    def _scaler_statistics(self, kind: str, values: np.ndarray,
+                           dtype: type = np.float32) -> Tuple[np.ndarray, np.ndarray]:
+        """(mean, 1 / scale) for kind as dtype: the offline statistics, or the scaler fitted on values."""
+        stats = self._scaler_stats.get(kind)
+        if stats is None:
+            scaler = self.scalers[kind].fit(values)
+            stats = (
+                scaler.mean_.astype(dtype),
+                (1.0 / scaler.scale_).astype(dtype)
+            )
+            self._scaler_stats[kind] = stats
+        return stats
+    
+    def _preprocess_numerical(self, data: Any) -> torch.Tensor:
+        """Standardize and clip numerical data with the cached scaler statistics."""
+        values = np.ascontiguousarray(data, dtype=np.float32)
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        
+        mean, inv_std = self._scaler_statistics('numerical', values)
+        clip = self.config.get('numerical_clip', NUMERICAL_CLIP)
+        scaled = _zscore_clip(values, mean, inv_std, -clip, clip)
+        return torch.from_numpy(scaled).to(self.device)
+    
+    def _preprocess_categorical(self, data: Any) -> torch.Tensor:
+        """Map categorical values to int32 vocabulary codes for the model's embedding table."""
+        values = np.asarray(data, dtype=object)
+        lookup = self._cat_vocab.get
+        codes = np.fromiter(
+            (lookup(value, 0) for value in values.flat),
+            dtype=np.int32,
+            count=values.size
+        ).reshape(values.shape)
+        return torch.from_numpy(codes).to(self.device)
+    
+    def _preprocess_temporal(self, data: Any) -> torch.Tensor:
+        """Standardize temporal values (e.g. timestamps) in one fused subtract-multiply pass.
+        
+        Centering runs in float64, since epoch timestamps exceed float32 precision;
+        only the standardized result is narrowed to float32.
+        """
+        values = np.ascontiguousarray(data, dtype=np.float64)
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        
+        mean, inv_std = self._scaler_statistics('temporal', values, dtype=np.float64)
+        return torch.from_numpy(((values - mean) * inv_std).astype(np.float32)).to(self.device)
     
     def _detect_errors(
         self,
@@ -144,32 +403,124 @@ class AutomatedErrorCorrector:
         context: Optional[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Detect errors in the processed data."""
-        try:
-            errors = {
-                'numerical_errors': self._detect_numerical_errors(
-                    processed_data.get('numerical')
-                ),
-                'categorical_errors': self._detect_categorical_errors(
-                    processed_data.get('categorical')
-                ),
-                'temporal_errors': self._detect_temporal_errors(
-                    processed_data.get('temporal')
-                ),
-                'contextual_errors': self._detect_contextual_errors(
-                    processed_data,
-                    context
-                )
-            }
-            
-            return errors
-            
-        except Exception as e:
-            self.error_handler.handle_error(
-                "Error detection failed",
-                str(e),
-                severity="high"
+        # One detection-model forward pass scores every modality
+        scores = self._score_modalities(processed_data)
+        
+        # The detectors are independent and torch releases the GIL in native ops
+        submit, run = self._pool.submit, self._run_detector
+        futures = {
+            'numerical_errors': submit(
+                run,
+                self._detect_numerical_errors,
+                processed_data.get('numerical'),
+                scores.get('numerical')
+            ),
+            'categorical_errors': submit(
+                run,
+                self._detect_categorical_errors,
+                processed_data.get('categorical'),
+                scores.get('categorical')
+            ),
+            'temporal_errors': submit(
+                run,
+                self._detect_temporal_errors,
+                processed_data.get('temporal'),
+                scores.get('temporal')
+            ),
+            'contextual_errors': submit(
+                run,
+                self._detect_contextual_errors,
+                processed_data,
+                context
             )
+        }
+        
+        return {name: future.result() for name, future in futures.items()}
+    
+    def _run_detector(self, detector: Any, *args: Any) -> Any:
+        """Run one detector on a pool thread.
+        
+        inference_mode is thread-local, so it is re-entered here. On CUDA each
+        detector gets its own stream, synchronized before returning.
+        """
+        with torch.inference_mode():
+            if self.device.type != 'cuda':
+                return detector(*args)
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                result = detector(*args)
+            stream.synchronize()
+            return result
+    
+    def _score_modalities(
+        self,
+        processed_data: Dict[str, torch.Tensor]
+    ) -> Dict[str, torch.Tensor]:
+        """Error probability per modality from a single batched detection-model call.
+        
+        Each present modality becomes one row of the batch, so the model is
+        dispatched once instead of once per modality.
+        """
+        modalities = [
+            modality for modality in ('numerical', 'categorical', 'temporal')
+            if processed_data.get(modality) is not None
+        ]
+        if not modalities:
             return {}
+        
+        texts = [self._modality_text(processed_data[modality]) for modality in modalities]
+        if self.device.type == 'cuda' and self.config.get('cuda_graphs', True):
+            # Fixed-length padding keeps shapes stable for graph replay
+            batch = self.tokenizer(
+                texts,
+                padding='max_length',
+                max_length=self.config.get('detection_seq_len', DETECTION_SEQ_LEN),
+                truncation=True,
+                return_tensors='pt'
+            ).to(self.device)
+            logits = self._replay_detection(dict(batch))
+        else:
+            batch = self.tokenizer(
+                texts,
+                padding=True,
+                truncation=True,
+                return_tensors='pt'
+            ).to(self.device)
+            logits = self.detection_model(**batch).logits
+        probabilities = logits.softmax(dim=-1)[:, 1]
+        return dict(zip(modalities, probabilities.unbind()))
+    
+    def _replay_detection(self, batch: Dict[str, torch.Tensor]) -> torch.Tensor:
+        """Run the detection model through a CUDA graph captured once per input shape."""
+        shape = tuple(batch['input_ids'].shape)
+        captured = self._detection_graphs.get(shape)
+        if captured is None:
+            static_inputs = {name: tensor.clone() for name, tensor in batch.items()}
+            
+            # Warm up on a side stream before capture, as CUDA graphs require
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                for _ in range(3):
+                    self.detection_model(**static_inputs)
+            torch.cuda.current_stream().wait_stream(stream)
+            
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph):
+                static_logits = self.detection_model(**static_inputs).logits
+            captured = (graph, static_inputs, static_logits)
+            self._detection_graphs[shape] = captured
+        
+        graph, static_inputs, static_logits = captured
+        for name, tensor in batch.items():
+            static_inputs[name].copy_(tensor)
+        graph.replay()
+        return static_logits.clone()
+    
+    def _modality_text(self, values: torch.Tensor) -> str:
+        """Flatten a preprocessed tensor into the text form fed to the detection model."""
+        return ' '.join(f"{value:.4g}" for value in values.flatten().tolist())
     
     def _analyze_error_patterns(
         self,
@@ -201,36 +552,27 @@ class AutomatedErrorCorrector:
         error_patterns: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Generate corrections for detected errors."""
-        try:
-            corrections = {
-                'numerical_corrections': self._generate_numerical_corrections(
-                    processed_data.get('numerical'),
-                    errors['numerical_errors']
-                ),
-                'categorical_corrections': self._generate_categorical_corrections(
-                    processed_data.get('categorical'),
-                    errors['categorical_errors']
-                ),
-                'temporal_corrections': self._generate_temporal_corrections(
-                    processed_data.get('temporal'),
-                    errors['temporal_errors']
-                ),
-                'contextual_corrections': self._generate_contextual_corrections(
-                    processed_data,
-                    errors['contextual_errors'],
-                    error_patterns
-                )
-            }
-            
-            return corrections
-            
-        except Exception as e:
-            self.error_handler.handle_error(
-                "Correction generation failed",
-                str(e),
-                severity="high"
+        corrections = {
+            'numerical_corrections': self._generate_numerical_corrections(
+                processed_data.get('numerical'),
+                errors['numerical_errors']
+            ),
+            'categorical_corrections': self._generate_categorical_corrections(
+                processed_data.get('categorical'),
+                errors['categorical_errors']
+            ),
+            'temporal_corrections': self._generate_temporal_corrections(
+                processed_data.get('temporal'),
+                errors['temporal_errors']
+            ),
+            'contextual_corrections': self._generate_contextual_corrections(
+                processed_data,
+                errors['contextual_errors'],
+                error_patterns
             )
-            return {}
+        }
+        
+        return corrections
     
     def _validate_corrections(
         self,
@@ -239,45 +581,36 @@ class AutomatedErrorCorrector:
         context: Optional[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Validate generated corrections."""
-        try:
-            # Validate individual corrections
-            validated = {
-                'numerical': self._validate_numerical_corrections(
-                    corrections['numerical_corrections'],
-                    processed_data.get('numerical')
-                ),
-                'categorical': self._validate_categorical_corrections(
-                    corrections['categorical_corrections'],
-                    processed_data.get('categorical')
-                ),
-                'temporal': self._validate_temporal_corrections(
-                    corrections['temporal_corrections'],
-                    processed_data.get('temporal')
-                ),
-                'contextual': self._validate_contextual_corrections(
-                    corrections['contextual_corrections'],
-                    processed_data,
-                    context
-                )
-            }
-            
-            # Check for consistency
-            consistent_corrections = self._check_correction_consistency(validated)
-            
-            # Filter low confidence corrections
-            filtered_corrections = self._filter_low_confidence_corrections(
-                consistent_corrections
-            )
-            
-            return filtered_corrections
-            
-        except Exception as e:
-            self.error_handler.handle_error(
-                "Correction validation failed",
-                str(e),
-                severity="high"
+        # Validate individual corrections
+        validated = {
+            'numerical': self._validate_numerical_corrections(
+                corrections['numerical_corrections'],
+                processed_data.get('numerical')
+            ),
+            'categorical': self._validate_categorical_corrections(
+                corrections['categorical_corrections'],
+                processed_data.get('categorical')
+            ),
+            'temporal': self._validate_temporal_corrections(
+                corrections['temporal_corrections'],
+                processed_data.get('temporal')
+            ),
+            'contextual': self._validate_contextual_corrections(
+                corrections['contextual_corrections'],
+                processed_data,
+                context
             )
-            return corrections
+        }
+        
+        # Check for consistency
+        consistent_corrections = self._check_correction_consistency(validated)
+        
+        # Filter low confidence corrections
+        filtered_corrections = self._filter_low_confidence_corrections(
+            consistent_corrections
+        )
+        
+        return filtered_corrections
     
     def _calculate_correction_confidence(
         self,
@@ -285,18 +618,18 @@ class AutomatedErrorCorrector:
     ) -> float:
         """Calculate confidence scores for corrections."""
         try:
-            confidence_scores = []
+            # Running sum and count; no intermediate list or array
+            total = 0.0
+            count = 0
             
-            for correction_type, type_corrections in corrections.items():
+            for type_corrections in corrections.values():
                 if isinstance(type_corrections, dict):
                     for correction in type_corrections.values():
                         if isinstance(correction, dict) and 'confidence' in correction:
-                            confidence_scores.append(correction['confidence'])
+                            total += correction['confidence']
+                            count += 1
             
-            if not confidence_scores:
-                return 0.0
-                
-            return np.mean(confidence_scores)
+            return total / count if count else 0.0
             
         except Exception as e:
             self.error_handler.handle_error(
@@ -309,11 +642,11 @@ class AutomatedErrorCorrector:
     def _get_fallback_results(
         self,
         input_data: ErrorData
-    ) -> Dict[str, Any]:
+    ) -> CorrectionResult:
         """Return fallback results when error correction fails."""
-        return {
-            'original_data': input_data,
-            'errors': {},
-            'corrections': {},
-            'confidence': 0.0
-        } 
\ No newline at end of file
+        return CorrectionResult(
+            original_data=input_data,
+            errors={},
+            corrections={},
+            confidence=0.0
+        ) 
\ No newline at end of file
@@ -1,13 +1,166 @@
-from typing import Dict, Any, List, Optional, Union
-import requests
+"""Fan-out of ML requests to external services (OpenAI, HuggingFace, Azure ML).
+
+Everything here is I/O-bound asyncio; run it on uvloop where available.
+The server package installs it at import (``uvloop.install()``); other
+entry points should do the same before creating their event loop.
+"""
+from typing import Dict, Any, Hashable, List, Mapping, Optional, Sequence, Tuple, Union
 import json
 import asyncio
+import string
 import aiohttp
+import functools
+import hashlib
+import numpy as np
+import orjson
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
+from operator import itemgetter
+from types import MappingProxyType
+from multidict import CIMultiDict, CIMultiDictProxy
 from ..utils.error_handler import ErrorHandler
 from ..config.api_config import APIConfig
 from ..models.ml_request import MLRequest
 from ..models.ml_response import MLResponse
+from .token_bucket import TokenBucket, shared_bucket
+
+# Static service tables, shared read-only by every integrator instance
+_SERVICE_ENDPOINTS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'openai': MappingProxyType({
+        'base_url': 'https://api.openai.com/v1',
+        'endpoints': MappingProxyType({
+            'completion': '/completions',
+            'embedding': '/embeddings'
+        })
+    }),
+    'huggingface': MappingProxyType({
+        'base_url': 'https://api-inference.huggingface.co/models',
+        'endpoints': MappingProxyType({
+            'inference': '/{model}'
+        })
+    }),
+    'azure_ml': MappingProxyType({
+        'base_url': 'https://{workspace}.azureml.net',
+        'endpoints': MappingProxyType({
+            'prediction': '/v1/service/{endpoint_name}/score'
+        })
+    })
+})
+
+_RATE_LIMITS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'openai': MappingProxyType({
+        'requests_per_minute': 60,
+        'tokens_per_minute': 150000
+    }),
+    'huggingface': MappingProxyType({
+        'requests_per_minute': 30,
+        'inference_time': 10
+    }),
+    'azure_ml': MappingProxyType({
+        'requests_per_second': 10,
+        'concurrent_requests': 5
+    })
+})
+
+@functools.lru_cache(maxsize=1)
+def _load_keys() -> Mapping[str, str]:
+    """Read the API keys once per process."""
+    return MappingProxyType(APIConfig().load_api_keys())
+
+# Last formatted UTC timestamp and the time.time() it was taken at
+_TS_CACHE: List[Any] = ['', 0.0]
+
+# Timestamps in response metadata are reused for up to this many seconds
+TIMESTAMP_RESOLUTION = 0.1
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format, reformatted at most every TIMESTAMP_RESOLUTION seconds."""
+    now = time.time()
+    if now - _TS_CACHE[1] > TIMESTAMP_RESOLUTION:
+        _TS_CACHE[:] = [datetime.utcfromtimestamp(now).isoformat(), now]
+    return _TS_CACHE[0]
+
+def _orjson_dumps(obj: Any) -> str:
+    """orjson encoder for aiohttp request bodies, which expect str."""
+    return orjson.dumps(obj).decode()
+
+# Response bodies larger than this are read in chunks of this size
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body with orjson.
+    
+    Large bodies are accumulated chunk by chunk into one growing buffer,
+    rather than buffered as a list of chunks and joined into a second copy.
+    """
+    length = response.content_length
+    if length is not None and length <= RESPONSE_CHUNK_SIZE:
+        return orjson.loads(await response.read())
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(RESPONSE_CHUNK_SIZE):
+        body += chunk
+    return orjson.loads(body)
+
+# Connection pool sizing for the shared HTTP session
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 20
+
+# In-flight requests allowed per service unless its rate limits set 'concurrent_requests'
+DEFAULT_CONCURRENT_REQUESTS = 10
+
+# Distinct (task, context shape) selections remembered per integrator
+SELECTION_CACHE_SIZE = 256
+
+# Seconds a single service call may take before it is abandoned
+SERVICE_TIMEOUT = 10
+
+# Consecutive failures after which a service is skipped, and for how many seconds
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN = 30
+
+# Errors that count against a service's breaker: transport failures, HTTP error
+# statuses (ClientResponseError) and timeouts. Errors raised while building the
+# request are the caller's fault and leave the breaker alone
+_SERVICE_FAILURES = (aiohttp.ClientError, asyncio.TimeoutError)
+
+# On-disk cache of successful responses and how long entries stay valid; the cache
+# is off unless config['response_cache_path'] names a database file
+RESPONSE_CACHE_PATH: Optional[str] = None
+RESPONSE_CACHE_TTL = 24 * 60 * 60
+
+# Most inputs sent in one call; longer input lists are split across several calls
+# (OpenAI's embeddings endpoint accepts up to 2048 per request)
+EMBEDDING_BATCH_SIZE = 2048
+
+# (service, endpoint) pairs that take a list of independent inputs and answer with
+# one item per input, so long inputs can be split across calls and merged back
+_BATCHED_ENDPOINTS = frozenset({('openai', 'embedding')})
+
+# Payload key carrying the input for services that don't use 'input'
+_INPUT_KEYS: Mapping[str, str] = MappingProxyType({'huggingface': 'inputs'})
+
+# Request parameters that route the request rather than being sent to the service
+_ROUTING_PARAMETERS = frozenset({'endpoint', 'task'})
+
+# Rough characters-per-token ratio used to estimate request size for token limits
+CHARS_PER_TOKEN = 4
+
+@dataclass(frozen=True, slots=True)
+class ServiceSpec:
+    """A service selected for a request, with its endpoint configuration and priority."""
+    name: str
+    config: Mapping[str, Any]
+    priority: float
+
+@dataclass(frozen=True, slots=True)
+class ServiceRequest:
+    """An outbound call to a service: target URL, JSON payload and headers."""
+    url: str
+    data: Any
+    headers: Mapping[str, str]
 
 class ExternalMLIntegrator:
     def __init__(self, config: Dict[str, Any]):
@@ -17,7 +170,91 @@ class ExternalMLIntegrator:
         self.service_endpoints = self._load_service_endpoints()
         self.api_keys = self._load_api_keys()
         self.rate_limiters = self._initialize_rate_limiters()
+        # Per-service request headers and full URL templates, built once
+        self._headers = {
+            service: self._build_headers(service)
+            for service in self.service_endpoints
+        }
+        self._url_templates = {
+            service: {
+                endpoint: config['base_url'] + path
+                for endpoint, path in config['endpoints'].items()
+            }
+            for service, config in self.service_endpoints.items()
+        }
+        # Parameters kept out of each endpoint's payload: routing keys plus its URL placeholders
+        self._excluded_parameters = {
+            service: {
+                endpoint: _ROUTING_PARAMETERS | {
+                    field for _, field, _, _ in string.Formatter().parse(template) if field
+                }
+                for endpoint, template in templates.items()
+            }
+            for service, templates in self._url_templates.items()
+        }
+        # Caps on concurrent calls per service, kept within the connector's per-host limit
+        self._semaphores = {
+            service: asyncio.Semaphore(min(
+                self.rate_limiters.get(service, {}).get('concurrent_requests', DEFAULT_CONCURRENT_REQUESTS),
+                MAX_CONNECTIONS_PER_HOST
+            ))
+            for service in self.service_endpoints
+        }
+        # Request-rate and token-rate buckets per service, shared process-wide
+        self._request_buckets: Dict[str, TokenBucket] = {}
+        self._token_buckets: Dict[str, TokenBucket] = {}
+        for service, limits in self.rate_limiters.items():
+            if 'requests_per_second' in limits:
+                rate = limits['requests_per_second']
+                self._request_buckets[service] = shared_bucket(service, 'requests', rate, rate)
+            elif 'requests_per_minute' in limits:
+                rate = limits['requests_per_minute']
+                self._request_buckets[service] = shared_bucket(service, 'requests', rate, rate / 60)
+            if 'tokens_per_minute' in limits:
+                rate = limits['tokens_per_minute']
+                self._token_buckets[service] = shared_bucket(service, 'tokens', rate, rate / 60)
+        # Circuit breaker per service: consecutive failures and the monotonic time it stays open until
+        self._breaker = {
+            service: {'fails': 0, 'open_until': 0.0}
+            for service in self.service_endpoints
+        }
+        self._cache = self._open_response_cache()
+        # The connection is used from worker threads, one statement at a time
+        self._cache_lock = threading.Lock()
+        # Priority-sorted service selections keyed by (task, context keys)
+        self._selection_cache: Dict[Tuple[Hashable, Tuple[str, ...]], Tuple[ServiceSpec, ...]] = {}
+        # One HTTP session for the integrator's lifetime, created on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
         
+    async def __aenter__(self) -> "ExternalMLIntegrator":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, so connections and DNS lookups are reused across requests."""
+        if self._session is None or self._session.closed:
+            async with self._session_lock:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(
+                            limit=MAX_CONNECTIONS,
+                            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                            ttl_dns_cache=300,
+                            keepalive_timeout=60
+                        ),
+                        json_serialize=_orjson_dumps
+                    )
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP session; call on application shutdown."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     async def process_request(
         self,
         request: MLRequest,
@@ -31,6 +268,17 @@ class ExternalMLIntegrator:
             # Select appropriate services
             selected_services = self._select_services(validated_request, context)
             
+            # Identical requests to the same services are answered from the cache
+            cache_key = self._response_cache_key(validated_request, selected_services)
+            cached = await asyncio.to_thread(self._cache_get, cache_key)
+            if cached is not None:
+                validated_results, metadata = cached
+                return MLResponse(
+                    request_id=request.request_id,
+                    results=validated_results,
+                    metadata=metadata
+                )
+            
             # Process request with selected services
             results = await self._process_with_services(
                 validated_request,
@@ -41,11 +289,15 @@ class ExternalMLIntegrator:
             # Combine and validate results
             combined_results = self._combine_results(results)
             validated_results = self._validate_results(combined_results)
+            metadata = self._generate_response_metadata(results)
+            
+            if self._is_cacheable(results, selected_services):
+                await asyncio.to_thread(self._cache_put, cache_key, (validated_results, metadata))
             
             return MLResponse(
                 request_id=request.request_id,
                 results=validated_results,
-                metadata=self._generate_response_metadata(results)
+                metadata=metadata
             )
             
         except Exception as e:
@@ -56,43 +308,104 @@ class ExternalMLIntegrator:
             )
             return self._get_fallback_response(request)
     
-    def _load_service_endpoints(self) -> Dict[str, Dict[str, Any]]:
-        """Load external service endpoint configurations."""
+    def _open_response_cache(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite response cache at config['response_cache_path'], if one is set."""
+        path = self.config.get('response_cache_path', RESPONSE_CACHE_PATH)
+        if path is None:
+            return None
         try:
-            return {
-                'openai': {
-                    'base_url': 'https://api.openai.com/v1',
-                    'endpoints': {
-                        'completion': '/completions',
-                        'embedding': '/embeddings'
-                    }
-                },
-                'huggingface': {
-                    'base_url': 'https://api-inference.huggingface.co/models',
-                    'endpoints': {
-                        'inference': '/{model}'
-                    }
-                },
-                'azure_ml': {
-                    'base_url': 'https://{workspace}.azureml.net',
-                    'endpoints': {
-                        'prediction': '/v1/service/{endpoint_name}/score'
-                    }
-                }
-            }
-            
-        except Exception as e:
+            connection = sqlite3.connect(path, check_same_thread=False)
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses '
+                '(key BLOB PRIMARY KEY, value BLOB NOT NULL, ts INTEGER NOT NULL)'
+            )
+            connection.execute('CREATE INDEX IF NOT EXISTS responses_ts ON responses (ts)')
+            connection.commit()
+            return connection
+        except sqlite3.Error as e:
             self.error_handler.handle_error(
-                "Service endpoint loading failed",
+                "Response cache unavailable",
                 str(e),
-                severity="critical"
+                severity="low"
             )
-            return {}
+            return None
+    
+    def _response_cache_key(
+        self,
+        request: MLRequest,
+        services: Sequence[ServiceSpec]
+    ) -> bytes:
+        """Digest of the request inputs, parameters and the services that would serve it."""
+        payload = json.dumps(
+            [request.input_data, request.parameters, [service.name for service in services]],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
     
-    def _load_api_keys(self) -> Dict[str, str]:
+    @staticmethod
+    def _is_cacheable(
+        results: Sequence[Dict[str, Any]],
+        services: Sequence[ServiceSpec]
+    ) -> bool:
+        """True when every selected service answered with a 2xx response that was merged.
+        
+        Results only exist for calls whose batches merged, so a missing result
+        means a failed, timed-out or unmergeable call; those are never cached.
+        """
+        return bool(results) and len(results) == len(services) and all(
+            200 <= result['metadata']['status'] < 300 for result in results
+        )
+
+    def _cache_get(self, key: bytes) -> Optional[Any]:
+        """Cached (results, metadata) for key, or None on a miss or expired entry.
+        
+        Blocking; called through asyncio.to_thread.
+        """
+        if self._cache is None:
+            return None
+        with self._cache_lock:
+            row = self._cache.execute(
+                'SELECT value, ts FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        if time.time() - row[1] > self.config.get('response_cache_ttl', RESPONSE_CACHE_TTL):
+            return None
+        return orjson.loads(row[0])
+    
+    def _cache_put(self, key: bytes, value: Any) -> None:
+        """Store value under key as JSON and purge entries older than the TTL.
+        
+        Values that are not JSON-serializable are not cached. Blocking; called
+        through asyncio.to_thread.
+        """
+        if self._cache is None:
+            return
+        try:
+            blob = orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            return
+        now = int(time.time())
+        with self._cache_lock:
+            self._cache.execute(
+                'INSERT OR REPLACE INTO responses (key, value, ts) VALUES (?, ?, ?)',
+                (key, blob, now)
+            )
+            self._cache.execute(
+                'DELETE FROM responses WHERE ts < ?',
+                (now - self.config.get('response_cache_ttl', RESPONSE_CACHE_TTL),)
+            )
+            self._cache.commit()
+    
+    def _load_service_endpoints(self) -> Mapping[str, Mapping[str, Any]]:
+        """Load external service endpoint configurations."""
+        return _SERVICE_ENDPOINTS
+    
+    def _load_api_keys(self) -> Mapping[str, str]:
         """Load API keys for external services."""
         try:
-            return self.api_config.load_api_keys()
+            return _load_keys()
             
         except Exception as e:
             self.error_handler.handle_error(
@@ -102,22 +415,17 @@ class ExternalMLIntegrator:
             )
             return {}
     
-    def _initialize_rate_limiters(self) -> Dict[str, Any]:
+    def _build_headers(self, service: str) -> CIMultiDictProxy:
+        """Read-only JSON and bearer-auth headers for a service."""
+        headers = CIMultiDict({'Content-Type': 'application/json'})
+        key = self.api_keys.get(service)
+        if key:
+            headers['Authorization'] = f'Bearer {key}'
+        return CIMultiDictProxy(headers)
+    
+    def _initialize_rate_limiters(self) -> Mapping[str, Mapping[str, Any]]:
         """Initialize rate limiters for external services."""
-        return {
-            'openai': {
-                'requests_per_minute': 60,
-                'tokens_per_minute': 150000
-            },
-            'huggingface': {
-                'requests_per_minute': 30,
-                'inference_time': 10
-            },
-            'azure_ml': {
-                'requests_per_second': 10,
-                'concurrent_requests': 5
-            }
-        }
+        return _RATE_LIMITS
     
     def _validate_request(self, request: MLRequest) -> MLRequest:
         """Validate and preprocess the ML request."""
@@ -149,28 +457,58 @@ class ExternalMLIntegrator:
         self,
         request: MLRequest,
         context: Optional[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Select appropriate external services for the request."""
+    ) -> Sequence[ServiceSpec]:
+        """Select appropriate external services for the request.
+        
+        Matching and priorities depend only on the request's task and the
+        shape of the context, so each such signature is resolved once.
+        """
+        signature = (
+            request.parameters.get('task'),
+            tuple(sorted(context)) if context else ()
+        )
+        selected = self._selection_cache.get(signature)
+        if selected is None:
+            selected = self._rank_services(request, context)
+            if selected:
+                if len(self._selection_cache) >= SELECTION_CACHE_SIZE:
+                    # Evict the oldest signature
+                    del self._selection_cache[next(iter(self._selection_cache))]
+                self._selection_cache[signature] = selected
+        
+        # Skip services whose circuit breaker is open
+        now = time.monotonic()
+        return tuple(
+            service for service in selected
+            if now >= self._breaker[service.name]['open_until']
+        )
+    
+    def _rank_services(
+        self,
+        request: MLRequest,
+        context: Optional[Dict[str, Any]]
+    ) -> Tuple[ServiceSpec, ...]:
+        """Matching services for the request, highest priority first."""
         try:
             selected = []
             
             # Check service capabilities
             for service, config in self.service_endpoints.items():
                 if self._service_matches_request(service, request, context):
-                    selected.append({
-                        'service': service,
-                        'config': config,
-                        'priority': self._calculate_service_priority(
+                    selected.append(ServiceSpec(
+                        name=service,
+                        config=config,
+                        priority=self._calculate_service_priority(
                             service,
                             request,
                             context
                         )
-                    })
+                    ))
             
             # Sort by priority
-            selected.sort(key=lambda x: x['priority'], reverse=True)
+            selected.sort(key=lambda x: x.priority, reverse=True)
             
-            return selected
+            return tuple(selected)
             
         except Exception as e:
             self.error_handler.handle_error(
@@ -178,37 +516,57 @@ class ExternalMLIntegrator:
                 str(e),
                 severity="medium"
             )
-            return []
+            return ()
     
     async def _process_with_services(
         self,
         request: MLRequest,
-        services: List[Dict[str, Any]],
+        services: Sequence[ServiceSpec],
         context: Optional[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Process request with selected external services."""
         try:
-            tasks = []
+            if not services:
+                return []
+            
+            session = await self._get_session()
+            timeout = self.config.get('service_timeout', SERVICE_TIMEOUT)
+            tasks = [
+                asyncio.ensure_future(self._call_service(
+                    session,
+                    service,
+                    request,
+                    context,
+                    timeout
+                ))
+                for service in services
+            ]
             
-            async with aiohttp.ClientSession() as session:
-                for service in services:
-                    task = self._process_single_service(
-                        session,
-                        service,
-                        request,
-                        context
+            try:
+                await asyncio.wait(tasks)
+            except asyncio.CancelledError:
+                # Don't leave service calls running when the caller goes away
+                for task in tasks:
+                    task.cancel()
+                raise
+            
+            # Keep successful results; failures were reported by the service call itself
+            valid_results = []
+            for service, task in zip(services, tasks):
+                error = task.exception()
+                if error is None:
+                    self._record_outcome(service.name, True)
+                    valid_results.append(task.result())
+                elif isinstance(error, _SERVICE_FAILURES):
+                    self._record_outcome(service.name, False)
+                if isinstance(error, asyncio.TimeoutError):
+                    self.error_handler.handle_error(
+                        f"Service {service.name} timed out",
+                        f"No response within {timeout}s",
+                        severity="medium"
                     )
-                    tasks.append(task)
-                
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Filter out failed results
-                valid_results = [
-                    r for r in results
-                    if not isinstance(r, Exception)
-                ]
-                
-                return valid_results
+            
+            return valid_results
                 
         except Exception as e:
             self.error_handler.handle_error(
@@ -218,57 +576,212 @@ class ExternalMLIntegrator:
             )
             return []
     
-    async def _process_single_service(
+    def _prepare_service_requests(
         self,
-        session: aiohttp.ClientSession,
-        service: Dict[str, Any],
+        service: ServiceSpec,
         request: MLRequest,
         context: Optional[Dict[str, Any]]
+    ) -> Tuple[ServiceRequest, ...]:
+        """Build the outbound calls from the service's precomputed URL template and headers.
+        
+        parameters['endpoint'] picks the endpoint (default: the service's first).
+        Parameters naming URL placeholders fill them; the rest, apart from the
+        routing keys 'endpoint' and 'task', are sent with the input.
+        Only batched endpoints (_BATCHED_ENDPOINTS) split a list input longer
+        than EMBEDDING_BATCH_SIZE into chunks; every other input goes out whole.
+        """
+        templates = self._url_templates[service.name]
+        endpoint = request.parameters.get('endpoint') or next(iter(templates))
+        url = templates[endpoint].format_map(request.parameters)
+        headers = self._headers[service.name]
+        key = _INPUT_KEYS.get(service.name, 'input')
+        excluded = self._excluded_parameters[service.name][endpoint]
+        parameters = {
+            name: value for name, value in request.parameters.items()
+            if name not in excluded
+        }
+        
+        data = request.input_data
+        if (
+            (service.name, endpoint) in _BATCHED_ENDPOINTS
+            and isinstance(data, list)
+            and len(data) > EMBEDDING_BATCH_SIZE
+        ):
+            batches = [
+                data[start:start + EMBEDDING_BATCH_SIZE]
+                for start in range(0, len(data), EMBEDDING_BATCH_SIZE)
+            ]
+        else:
+            batches = [data]
+        return tuple(
+            ServiceRequest(url=url, data=dict(parameters, **{key: batch}), headers=headers)
+            for batch in batches
+        )
+    
+    async def _post(
+        self,
+        session: aiohttp.ClientSession,
+        service: str,
+        service_request: ServiceRequest
+    ) -> Tuple[Any, int, Optional[str]]:
+        """Send one call within the service's concurrency cap; returns (data, status, latency header).
+        
+        Error statuses (429, 5xx, ...) raise aiohttp.ClientResponseError, so they
+        count as failed calls rather than as results.
+        """
+        async with self._semaphores[service]:
+            async with session.post(
+                service_request.url,
+                json=service_request.data,
+                headers=service_request.headers
+            ) as response:
+                response.raise_for_status()
+                return (
+                    await _read_json(response),
+                    response.status,
+                    response.headers.get('x-process-time')
+                )
+    
+    @staticmethod
+    def _merge_batch_responses(responses: List[Any]) -> Any:
+        """Join per-batch responses back into one, in original input order.
+        
+        List responses are concatenated; OpenAI-style {'data': [...]} responses
+        have their items' 'index' shifted by the batch offset. Any other shape
+        raises ValueError rather than changing the response contract.
+        """
+        if len(responses) == 1:
+            return responses[0]
+        if all(isinstance(response, list) for response in responses):
+            return [item for response in responses for item in response]
+        if all(isinstance(response, dict) and isinstance(response.get('data'), list) for response in responses):
+            items = []
+            for batch, response in enumerate(responses):
+                offset = batch * EMBEDDING_BATCH_SIZE
+                items.extend(
+                    dict(item, index=item['index'] + offset)
+                    if isinstance(item, dict) and 'index' in item else item
+                    for item in response['data']
+                )
+            return dict(responses[0], data=items)
+        raise ValueError("Batched responses have no mergeable shape")
+    
+    def _record_outcome(self, service: str, succeeded: bool) -> None:
+        """Update a service's circuit breaker, opening it after repeated consecutive failures."""
+        breaker = self._breaker[service]
+        if succeeded:
+            breaker['fails'] = 0
+            return
+        breaker['fails'] += 1
+        if breaker['fails'] >= self.config.get('breaker_failure_threshold', BREAKER_FAILURE_THRESHOLD):
+            breaker['open_until'] = time.monotonic() + self.config.get('breaker_cooldown', BREAKER_COOLDOWN)
+            breaker['fails'] = 0
+            self.error_handler.handle_error(
+                f"Service {service} circuit opened",
+                f"Skipping it for {self.config.get('breaker_cooldown', BREAKER_COOLDOWN)}s after repeated failures",
+                severity="medium"
+            )
+    
+    async def _call_service(
+        self,
+        session: aiohttp.ClientSession,
+        service: ServiceSpec,
+        request: MLRequest,
+        context: Optional[Dict[str, Any]],
+        timeout: float
     ) -> Dict[str, Any]:
-        """Process request with a single external service."""
+        """Wait for the service's rate limits, then make its calls within timeout.
+        
+        Throttling happens before the timeout starts, so waiting for request
+        or token budget is never reported as a timeout or fed to the breaker.
+        """
         try:
-            # Prepare request for service
-            service_request = self._prepare_service_request(
+            # Prepare request for service, one call per input batch
+            service_requests = self._prepare_service_requests(
                 service,
                 request,
                 context
             )
+        except Exception as e:
+            self.error_handler.handle_error(
+                f"Service {service.name} processing failed",
+                str(e),
+                severity="medium"
+            )
+            raise
+        
+        # Check rate limits
+        await self._check_rate_limits(service.name, request, calls=len(service_requests))
+        
+        return await asyncio.wait_for(
+            self._process_single_service(session, service, service_requests),
+            timeout
+        )
+    
+    async def _process_single_service(
+        self,
+        session: aiohttp.ClientSession,
+        service: ServiceSpec,
+        service_requests: Sequence[ServiceRequest]
+    ) -> Dict[str, Any]:
+        """Process request with a single external service."""
+        try:
+            # Make API calls
+            replies = await asyncio.gather(*(
+                self._post(session, service.name, service_request)
+                for service_request in service_requests
+            ))
+            response_data = self._merge_batch_responses([data for data, _, _ in replies])
+            status = max(status for _, status, _ in replies)
+            latency = replies[0][2] if len(replies) == 1 else sum(
+                float(latency or 0) for _, _, latency in replies
+            )
             
-            # Check rate limits
-            await self._check_rate_limits(service['service'])
+            # Process response
+            processed_response = self._process_service_response(
+                service.name,
+                response_data
+            )
             
-            # Make API call
-            async with session.post(
-                service_request['url'],
-                json=service_request['data'],
-                headers=service_request['headers']
-            ) as response:
-                response_data = await response.json()
-                
-                # Process response
-                processed_response = self._process_service_response(
-                    service['service'],
-                    response_data
-                )
-                
-                return {
-                    'service': service['service'],
-                    'response': processed_response,
-                    'metadata': {
-                        'timestamp': datetime.utcnow().isoformat(),
-                        'status': response.status,
-                        'latency': response.headers.get('x-process-time')
-                    }
+            return {
+                'service': service.name,
+                'response': processed_response,
+                'metadata': {
+                    'timestamp': _now_iso(),
+                    'status': status,
+                    'latency': latency
                 }
+            }
                 
         except Exception as e:
             self.error_handler.handle_error(
-                f"Service {service['service']} processing failed",
+                f"Service {service.name} processing failed",
                 str(e),
                 severity="medium"
             )
             raise
     
+    async def _check_rate_limits(
+        self,
+        service: str,
+        request: Optional[MLRequest] = None,
+        calls: int = 1
+    ) -> None:
+        """Wait until the service's request and token budgets allow `calls` more calls."""
+        bucket = self._request_buckets.get(service)
+        if bucket is not None:
+            await bucket.acquire(calls)
+        
+        bucket = self._token_buckets.get(service)
+        if bucket is not None and request is not None:
+            await bucket.acquire(self._estimate_tokens(request))
+    
+    def _estimate_tokens(self, request: MLRequest) -> int:
+        """Approximate the token count of a request's input data."""
+        data = request.input_data
+        text = data if isinstance(data, str) else json.dumps(data, default=str)
+        return max(1, len(text) // CHARS_PER_TOKEN)
+    
     def _combine_results(
         self,
         results: List[Dict[str, Any]]
@@ -328,13 +841,15 @@ class ExternalMLIntegrator:
         results: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Generate metadata for the response."""
+        latencies = np.fromiter(
+            (r['metadata'].get('latency') or 0 for r in results),
+            dtype=np.float64,
+            count=len(results)
+        )
         return {
-            'timestamp': datetime.utcnow().isoformat(),
-            'services_used': [r['service'] for r in results],
-            'processing_time': sum(
-                float(r['metadata']['latency'] or 0)
-                for r in results
-            ),
+            'timestamp': _now_iso(),
+            'services_used': list(map(itemgetter('service'), results)),
+            'processing_time': float(latencies.sum()),
             'success_rate': len(results) / len(self.service_endpoints)
         }
     
@@ -347,7 +862,7 @@ class ExternalMLIntegrator:
             request_id=request.request_id,
             results={},
             metadata={
-                'timestamp': datetime.utcnow().isoformat(),
+                'timestamp': _now_iso(),
                 'status': 'failed',
                 'error': 'Processing failed, using fallback response'
             }
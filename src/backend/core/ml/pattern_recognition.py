@@ -1,10 +1,10 @@
 from typing import Dict, Any, List, Optional, Tuple
+from contextlib import nullcontext
 import numpy as np
 import torch
 import torch.nn as nn
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
-from transformers import AutoModel, AutoTokenizer
 from ..utils.error_handler import ErrorHandler
 from ..models.pattern_data import PatternData
 
@@ -14,6 +14,12 @@ class EnhancedPatternRecognizer:
         self.config = config
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         
+        # One persistent CUDA stream per analyzer, reused across calls
+        self._streams = (
+            [torch.cuda.Stream(self.device) for _ in range(5)]
+            if self.device.type == 'cuda' else []
+        )
+        
         # Initialize components
         self._initialize_models()
         self._initialize_preprocessors()
@@ -26,17 +32,28 @@ class EnhancedPatternRecognizer:
     ) -> Dict[str, Any]:
         """Analyze patterns in the input data using multiple techniques."""
         try:
-            # Preprocess input data
-            processed_data = self._preprocess_data(input_data)
-            
-            # Apply different pattern recognition techniques
-            results = {
-                'temporal_patterns': self._analyze_temporal_patterns(processed_data),
-                'event_correlations': self._analyze_event_correlations(processed_data),
-                'astrological_patterns': self._analyze_astrological_patterns(processed_data),
-                'behavioral_patterns': self._analyze_behavioral_patterns(processed_data),
-                'contextual_patterns': self._analyze_contextual_patterns(processed_data, context)
-            }
+            try:
+                # Preprocess input data
+                processed_data = self._preprocess_data(input_data)
+                
+                # Apply different pattern recognition techniques, each on its own
+                # CUDA stream so their kernels can overlap on the GPU
+                analyzers = (
+                    ('temporal_patterns', self._analyze_temporal_patterns, (processed_data,)),
+                    ('event_correlations', self._analyze_event_correlations, (processed_data,)),
+                    ('astrological_patterns', self._analyze_astrological_patterns, (processed_data,)),
+                    ('behavioral_patterns', self._analyze_behavioral_patterns, (processed_data,)),
+                    ('contextual_patterns', self._analyze_contextual_patterns, (processed_data, context))
+                )
+                results = {
+                    key: self._run_on_stream(index, analyzer, *args)
+                    for index, (key, analyzer, args) in enumerate(analyzers)
+                }
+            finally:
+                # The pinned and arena buffers are refilled by the next call, so wait
+                # for every copy and stream kernel even when a stage raised
+                if self.device.type == 'cuda':
+                    torch.cuda.synchronize(self.device)
             
             # Combine and validate results
             combined_results = self._combine_pattern_results(results)
@@ -56,19 +73,19 @@ class EnhancedPatternRecognizer:
         """Initialize various pattern recognition models."""
         try:
             # Temporal pattern model
-            self.temporal_model = self._create_temporal_model()
+            self.temporal_model = self._prepare_model(self._create_temporal_model())
             
             # Event correlation model
-            self.correlation_model = self._create_correlation_model()
+            self.correlation_model = self._prepare_model(self._create_correlation_model())
             
             # Astrological pattern model
-            self.astrological_model = self._create_astrological_model()
+            self.astrological_model = self._prepare_model(self._create_astrological_model())
             
             # Behavioral pattern model
-            self.behavioral_model = self._create_behavioral_model()
+            self.behavioral_model = self._prepare_model(self._create_behavioral_model())
             
             # Contextual pattern model
-            self.context_model = self._create_context_model()
+            self.context_model = self._prepare_model(self._create_context_model())
             
         except Exception as e:
             self.error_handler.handle_error(
@@ -77,6 +94,17 @@ class EnhancedPatternRecognizer:
                 severity="critical"
             )
     
+    def _prepare_model(self, model: nn.Module) -> nn.Module:
+        """Put a model in eval mode on the target device, with int8 Linear/LSTM layers on CPU.
+        
+        On CUDA the weights stay FP32 and the analyzers run under BF16 autocast.
+        """
+        model.eval()
+        model.to(self.device)
+        if self.device.type == 'cpu' and self.config.get('quantize_cpu', True):
+            model = torch.ao.quantization.quantize_dynamic(model, {nn.Linear, nn.LSTM}, dtype=torch.qint8)
+        return model
+    
     def _initialize_preprocessors(self):
         """Initialize data preprocessing components."""
         self.scalers = {
@@ -87,7 +115,18 @@ class EnhancedPatternRecognizer:
         }
         
         self.pca = PCA(n_components=0.95)  # Preserve 95% variance
-        self.tokenizer = AutoTokenizer.from_pretrained('bert-base-uncased')
+        from transformers import AutoTokenizer
+        self.tokenizer = AutoTokenizer.from_pretrained('bert-base-uncased', use_fast=True)
+        
+        # Pinned host staging buffers per modality, grown on demand, for async host-to-device copies
+        self._pinned: Dict[str, torch.Tensor] = {}
+        # Device-side arena per modality that preprocessed inputs are copied into in place.
+        # config['buffer_sizes'] ({modality: elements}) preallocates them; otherwise they
+        # grow to the largest input seen
+        self._device_buffers: Dict[str, torch.Tensor] = {}
+        if self.device.type == 'cuda':
+            for modality, size in self.config.get('buffer_sizes', {}).items():
+                self._device_buffers[modality] = torch.empty(size, dtype=torch.float32, device=self.device)
     
     def _load_pattern_templates(self):
         """Load predefined pattern templates and rules."""
@@ -123,7 +162,11 @@ class EnhancedPatternRecognizer:
                     data.behavioral_data
                 )
             
-            return processed
+            # Issue every modality's host-to-device copy before any analysis runs
+            return {
+                modality: self._to_device(modality, tensor)
+                for modality, tensor in processed.items()
+            }
             
         except Exception as e:
             self.error_handler.handle_error(
@@ -133,6 +176,56 @@ class EnhancedPatternRecognizer:
             )
             return {}
     
+    def _to_device(self, modality: str, tensor: torch.Tensor) -> torch.Tensor:
+        """Copy a preprocessed CPU tensor into the modality's device arena via a reused pinned buffer.
+        
+        The copy is non-blocking and the result is a view into the arena;
+        analyze_patterns synchronizes the device, on success and on error,
+        before either buffer is refilled.
+        """
+        if self.device.type != 'cuda' or tensor.device.type != 'cpu':
+            return tensor.to(self.device)
+        
+        n = tensor.numel()
+        buffer = self._pinned.get(modality)
+        if buffer is None or buffer.numel() < n or buffer.dtype != tensor.dtype:
+            buffer = torch.empty(n, dtype=tensor.dtype, pin_memory=True)
+            self._pinned[modality] = buffer
+        staged = buffer[:n].view(tensor.shape)
+        staged.copy_(tensor)
+        
+        arena = self._device_buffers.get(modality)
+        if arena is None or arena.numel() < n or arena.dtype != tensor.dtype:
+            arena = torch.empty(n, dtype=tensor.dtype, device=self.device)
+            self._device_buffers[modality] = arena
+        return arena[:n].view(tensor.shape).copy_(staged, non_blocking=True)
+    
+    def release_buffers(self) -> None:
+        """Free the staging and device buffers; call on shutdown."""
+        self._pinned.clear()
+        self._device_buffers.clear()
+        if self.device.type == 'cuda':
+            torch.cuda.empty_cache()
+    
+    def _autocast(self):
+        """BF16 autocast for analyzer forwards on CUDA; a no-op on CPU."""
+        if self.device.type == 'cuda':
+            return torch.autocast(device_type='cuda', dtype=torch.bfloat16)
+        return nullcontext()
+    
+    def _run_on_stream(self, index: int, analyzer: Any, *args: Any) -> Dict[str, Any]:
+        """Run an analyzer under BF16 autocast on CUDA stream ``index`` (directly on CPU).
+        
+        Combination and validation run outside autocast, in FP32.
+        """
+        if self.device.type != 'cuda':
+            return analyzer(*args)
+        stream = self._streams[index]
+        # Inputs were copied on the current stream
+        stream.wait_stream(torch.cuda.current_stream(self.device))
+        with torch.cuda.stream(stream), self._autocast():
+            return analyzer(*args)
+    
     def _analyze_temporal_patterns(
         self,
         processed_data: Dict[str, torch.Tensor]
@@ -0,0 +1,66 @@
+from typing import Dict, Tuple
+import asyncio
+import threading
+import time
+import weakref
+
+class TokenBucket:
+    """Async token bucket holding up to capacity tokens, refilled at refill_rate tokens per second.
+    
+    One bucket may be shared by several event loops (e.g. one per worker thread):
+    the token count is guarded by a thread lock, and waiters queue on an
+    asyncio.Lock created lazily for the loop they run on.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._state_lock = threading.Lock()
+        # FIFO waiter queue per running event loop, dropped with the loop
+        self._loop_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+    
+    def _loop_lock(self) -> asyncio.Lock:
+        """The waiter lock for the running event loop, created on first use there."""
+        loop = asyncio.get_running_loop()
+        with self._state_lock:
+            lock = self._loop_locks.get(loop)
+            if lock is None:
+                lock = self._loop_locks[loop] = asyncio.Lock()
+        return lock
+    
+    def _refill(self) -> None:
+        """Credit the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+    
+    async def acquire(self, n: float = 1) -> None:
+        """Take n tokens, sleeping until the bucket has refilled enough.
+        
+        Waiters on the same loop are served in arrival order; requests larger
+        than the bucket are clamped to its capacity so they cannot wait forever.
+        """
+        n = min(n, self.capacity)
+        async with self._loop_lock():
+            while True:
+                with self._state_lock:
+                    self._refill()
+                    if self._tokens >= n:
+                        self._tokens -= n
+                        return
+                    delay = (n - self._tokens) / self.refill_rate
+                await asyncio.sleep(delay)
+
+# Buckets shared by every caller limiting the same service dimension
+_BUCKETS: Dict[Tuple[str, str], TokenBucket] = {}
+
+def shared_bucket(service: str, dimension: str, capacity: float, refill_rate: float) -> TokenBucket:
+    """Return the process-wide bucket for (service, dimension), creating it on first use."""
+    bucket = _BUCKETS.get((service, dimension))
+    if bucket is None:
+        bucket = _BUCKETS[(service, dimension)] = TokenBucket(capacity, refill_rate)
+    return bucket
@@ -1,22 +1,138 @@
 """
 Unified ML Engine
 Combines ML-based birth time rectification and model management functionality.
+
+Torch intra-op threads default to half the logical CPUs to avoid
+oversubscription under concurrent requests; set OMP_NUM_THREADS (about the
+number of physical cores) to choose explicitly.
 """
 
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Callable, Dict, Any, List, Optional, Union, Tuple
 import torch
 from torch import nn
 import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import asyncio
+import atexit
+import hashlib
+import io
 import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
 import joblib
 from sklearn.ensemble import RandomForestClassifier
 from ..utils.versioning import ModelVersion
 from ..utils.error_handler import ErrorHandler
 from ..models.prediction_result import PredictionResult
 
+try:
+    # Optional ONNX export and runtime for fitted tree ensembles
+    import onnxruntime
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+except ImportError:
+    onnxruntime = None
+
+try:
+    # Optional compiler of tree ensembles to native shared libraries
+    import tl2cgen
+    import treelite
+except ImportError:
+    tl2cgen = None
+
 logger = logging.getLogger(__name__)
 
+# x86 INT8 kernels for the quantized torch models, where this build has them
+if 'fbgemm' in torch.backends.quantized.supported_engines:
+    torch.backends.quantized.engine = 'fbgemm'
+
+# Training inputs kept per model type to calibrate static quantization
+CALIBRATION_SAMPLES = 256
+
+# Prediction log: ring buffer size, file it is drained to, and how often (seconds);
+# nothing is recorded unless PREDICTION_LOG_PATH is set
+PREDICTION_LOG_SIZE = 10_000
+PREDICTION_LOG_PATH: Optional[str] = os.environ.get('PREDICTION_LOG_PATH')
+PREDICTION_LOG_INTERVAL = 5.0
+
+# (monotonic ns, model type, confidence) per prediction from every engine, appended
+# to PREDICTION_LOG_PATH by one daemon thread started on first use
+_PRED_LOG: deque = deque(maxlen=PREDICTION_LOG_SIZE)
+_log_thread: Optional[threading.Thread] = None
+_log_thread_lock = threading.Lock()
+
+def _flush_prediction_log() -> None:
+    """Write out and drop every buffered prediction record."""
+    records = []
+    while _PRED_LOG:
+        records.append(_PRED_LOG.popleft())
+    if not records:
+        return
+    try:
+        with open(PREDICTION_LOG_PATH, 'a') as log_file:
+            log_file.writelines(
+                f"{ns}\t{model_type}\t{confidence}\n"
+                for ns, model_type, confidence in records
+            )
+    except OSError as e:
+        logger.warning(f"Could not write prediction log: {str(e)}")
+
+def _drain_prediction_log() -> None:
+    """Flush the prediction log every PREDICTION_LOG_INTERVAL seconds for the life of the process."""
+    while True:
+        time.sleep(PREDICTION_LOG_INTERVAL)
+        _flush_prediction_log()
+
+def _start_prediction_log() -> None:
+    """Start the shared drainer thread and the exit-time flush, once per process."""
+    global _log_thread
+    with _log_thread_lock:
+        if _log_thread is None:
+            _log_thread = threading.Thread(
+                target=_drain_prediction_log,
+                name='prediction-log',
+                daemon=True
+            )
+            _log_thread.start()
+            atexit.register(_flush_prediction_log)
+
+# torch CPU thread pools are process-wide, so they are sized once by the first engine
+_threads_configured = False
+_threads_lock = threading.Lock()
+
+def _configure_threads() -> None:
+    """Pin torch CPU thread pools once per process unless OMP_NUM_THREADS already sizes them."""
+    global _threads_configured
+    with _threads_lock:
+        if _threads_configured:
+            return
+        _threads_configured = True
+        if 'OMP_NUM_THREADS' not in os.environ:
+            torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Only settable before the first parallel work in the process
+            logger.debug("torch inter-op thread pool already started; keeping its size")
+
+# Flat feature layout shared by every model: birth details, then one contiguous
+# run per position field across all bodies (structure of arrays)
+_BIRTH_FIELDS = ('latitude', 'longitude', 'hour', 'minute', 'second', 'timezone_offset')
+_BODIES = ('Sun', 'Moon', 'Mars', 'Mercury', 'Jupiter', 'Venus', 'Saturn', 'Rahu', 'Ketu',
+           'Ascendant', 'Midheaven')
+_POSITION_FIELDS = ('longitude', 'latitude', 'speed', 'house')
+_FEATURE_SCHEMA: Tuple[Tuple[str, str], ...] = (
+    tuple(('birth_data', field) for field in _BIRTH_FIELDS) +
+    tuple((body, field) for field in _POSITION_FIELDS for body in _BODIES)
+)
+# Body longitudes, the sequence the pattern-recognition CNN convolves over
+_LONGITUDES = slice(len(_BIRTH_FIELDS), len(_BIRTH_FIELDS) + len(_BODIES))
+
 class UnifiedMLEngine:
     def __init__(self, api_key: Optional[str] = None):
         """Initialize unified ML engine with all capabilities."""
@@ -26,6 +142,21 @@ class UnifiedMLEngine:
         self.current_version = None
         self.error_handler = ErrorHandler()
         self.training_stats = {}
+        # Inference-only forms of the models (ONNX forests, INT8 networks) keyed by
+        # model type; self.models keeps the trainable originals for versioning
+        self._compiled: Dict[str, Callable[[torch.Tensor], Any]] = {}
+        self._calibration: Dict[str, torch.Tensor] = {}
+        # Serialized model weights keyed by their sha256, shared by every version
+        # that contains them; ModelVersion.models maps model type -> digest
+        self._weight_store: Dict[str, bytes] = {}
+        # Compiled forest predictors keyed by the weight digest they were built from,
+        # so updates and rollbacks reuse them instead of recompiling
+        self._compiled_forests: Dict[str, Callable[[torch.Tensor], Any]] = {}
+        # Serialized TorchScript inference modules per version, reloaded on rollback
+        self._scripted: Dict[str, Dict[str, bytes]] = {}
+        # One worker per analysis model, shared across requests
+        self._pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='ml-predict')
+        _configure_threads()
         self.initialize_models()
 
     def initialize_models(self):
@@ -35,17 +166,22 @@ class UnifiedMLEngine:
             self.models['birth_time'] = self._create_birth_time_model()
             self.models['event_correlation'] = self._create_event_correlation_model()
             self.models['pattern_recognition'] = self._create_pattern_recognition_model()
+            for model in self.models.values():
+                if isinstance(model, nn.Module):
+                    model.eval()
+            self._compile_models()
             
             # Create initial version
             initial_version = ModelVersion(
                 version="1.0.0",
                 timestamp=datetime.now(),
-                models=self.models.copy(),
+                models=self._snapshot_models(),
                 metrics={}
             )
             
             self.version_history.append(initial_version)
             self.current_version = initial_version
+            self._scripted[initial_version.version] = self._serialize_scripted()
             
         except Exception as e:
             self.error_handler.handle_error(
@@ -69,10 +205,15 @@ class UnifiedMLEngine:
                 questionnaire_responses
             )
             
-            # Get predictions from relevant models
-            birth_time_pred = self.predict(input_data, 'birth_time')
-            event_corr_pred = self.predict(input_data, 'event_correlation')
-            pattern_pred = self.predict(input_data, 'pattern_recognition')
+            # Get predictions from relevant models concurrently, off the event loop;
+            # torch and sklearn release the GIL inside their native kernels. The
+            # input is encoded once here and every worker reads the same vector
+            features = self._encode_features(input_data)
+            loop = asyncio.get_running_loop()
+            birth_time_pred, event_corr_pred, pattern_pred = await asyncio.gather(*(
+                loop.run_in_executor(self._pool, self.predict, input_data, model_type, features)
+                for model_type in ('birth_time', 'event_correlation', 'pattern_recognition')
+            ))
             
             # Combine predictions
             combined_results = self._combine_predictions(
@@ -128,20 +269,23 @@ class UnifiedMLEngine:
     def predict(
         self,
         input_data: Dict[str, Any],
-        model_type: str
+        model_type: str,
+        features: Optional[np.ndarray] = None
     ) -> PredictionResult:
-        """Make predictions using specified model type."""
+        """Make predictions using specified model type.
+        
+        features, when given, is input_data already encoded by _encode_features.
+        """
         try:
             if model_type not in self.models:
                 raise ValueError(f"Unknown model type: {model_type}")
                 
-            model = self.models[model_type]
-            
             # Preprocess input data
-            processed_data = self._preprocess_data(input_data, model_type)
+            processed_data = self._preprocess_data(input_data, model_type, features)
             
             # Make prediction
-            prediction = model.predict(processed_data)
+            with torch.inference_mode():
+                prediction = self._forward(model_type, processed_data)
             
             # Calculate confidence
             confidence = self._calculate_prediction_confidence(
@@ -167,6 +311,45 @@ class UnifiedMLEngine:
             )
             return self._get_fallback_prediction(model_type)
 
+    def predict_batch(
+        self,
+        input_data: Dict[str, Any],
+        model_types: List[str]
+    ) -> Dict[str, PredictionResult]:
+        """Make predictions for the same input with several model types in one pass.
+        
+        All forwards run inside a single inference-mode block; a failing model
+        type gets its fallback prediction without affecting the others.
+        """
+        results = {}
+        features = self._encode_features(input_data)
+        with torch.inference_mode():
+            for model_type in model_types:
+                try:
+                    if model_type not in self.models:
+                        raise ValueError(f"Unknown model type: {model_type}")
+                    processed_data = self._preprocess_data(input_data, model_type, features)
+                    prediction = self._forward(model_type, processed_data)
+                    confidence = self._calculate_prediction_confidence(
+                        prediction,
+                        processed_data,
+                        model_type
+                    )
+                    self._log_prediction(input_data, prediction, confidence, model_type)
+                    results[model_type] = PredictionResult(
+                        prediction=prediction,
+                        confidence=confidence,
+                        model_version=self.current_version.version
+                    )
+                except Exception as e:
+                    self.error_handler.handle_error(
+                        "Prediction error",
+                        str(e),
+                        severity="medium"
+                    )
+                    results[model_type] = self._get_fallback_prediction(model_type)
+        return results
+
     def update_model(
         self,
         model_type: str,
@@ -181,6 +364,13 @@ class UnifiedMLEngine:
             # Create new model instance
             new_model = self._create_model(model_type)
             
+            # Keep a slice of the inputs to calibrate INT8 activations
+            if training_data.get('inputs') is not None:
+                self._calibration[model_type] = torch.as_tensor(
+                    training_data['inputs'][:CALIBRATION_SAMPLES],
+                    dtype=torch.float32
+                )
+            
             # Train on new data
             training_metrics = self._train_model(
                 new_model,
@@ -192,6 +382,7 @@ class UnifiedMLEngine:
             if self._validate_model_performance(new_model, training_metrics):
                 # Update model and create new version
                 self.models[model_type] = new_model
+                self._compile_models()
                 self._create_new_version(model_type, training_metrics)
                 
                 # Update training stats
@@ -213,7 +404,8 @@ class UnifiedMLEngine:
             )
             
             if target_version:
-                self.models = target_version.models.copy()
+                self.models = self._restore_models(target_version.models)
+                self._compile_models(self._scripted.get(version))
                 self.current_version = target_version
                 
         except Exception as e:
@@ -260,6 +452,203 @@ class UnifiedMLEngine:
         )
         return model
 
+    def _forward(self, model_type: str, processed_data: torch.Tensor) -> Any:
+        """Run a preprocessed input through the model's inference form, or the model itself."""
+        compiled = self._compiled.get(model_type)
+        if compiled is not None:
+            return compiled(processed_data)
+        model = self.models[model_type]
+        if isinstance(model, nn.Module):
+            return model(processed_data)
+        return model.predict(processed_data)
+
+    def _compile_models(self, scripted: Optional[Dict[str, bytes]] = None):
+        """Build inference forms of self.models.
+        
+        Fitted forests are served through ONNX; networks become frozen
+        TorchScript INT8 modules, loaded from `scripted` when it has them.
+        """
+        self._compiled = {}
+        scripted = scripted or {}
+        for model_type, model in self.models.items():
+            compiled = None
+            if isinstance(model, RandomForestClassifier) and hasattr(model, 'estimators_'):
+                digest = self._store_weights(model)
+                compiled = self._compiled_forests.get(digest)
+                if compiled is None:
+                    compiled = self._compile_forest_native(model) or self._compile_forest(model)
+                    if compiled is not None:
+                        self._compiled_forests[digest] = compiled
+            elif model_type in scripted:
+                compiled = torch.jit.load(io.BytesIO(scripted[model_type]))
+            elif isinstance(model, nn.Module):
+                compiled = self._script(self._quantize(model_type, model))
+            if compiled is not None:
+                self._compiled[model_type] = compiled
+
+    @staticmethod
+    def _fusable_pairs(model: nn.Module) -> List[List[str]]:
+        """Names of adjacent (Conv1d | Linear, ReLU) children of a Sequential model."""
+        children = list(model.named_children())
+        return [
+            [name, next_name]
+            for (name, layer), (next_name, next_layer) in zip(children, children[1:])
+            if isinstance(layer, (nn.Conv1d, nn.Linear)) and isinstance(next_layer, nn.ReLU)
+        ]
+
+    def _script(self, model: nn.Module) -> nn.Module:
+        """Frozen, inference-optimized TorchScript form of a module; the module itself if scripting fails."""
+        try:
+            scripted = torch.jit.script(model).eval()
+            return torch.jit.optimize_for_inference(torch.jit.freeze(scripted))
+        except Exception as e:
+            logger.warning(f"TorchScript compilation failed, running eagerly: {str(e)}")
+            return model
+
+    def _serialize_scripted(self) -> Dict[str, bytes]:
+        """Saved bytes of the current TorchScript inference modules, keyed by model type."""
+        serialized = {}
+        for model_type, compiled in self._compiled.items():
+            if isinstance(compiled, torch.jit.ScriptModule):
+                buffer = io.BytesIO()
+                torch.jit.save(compiled, buffer)
+                serialized[model_type] = buffer.getvalue()
+        return serialized
+
+    def _quantize(self, model_type: str, model: nn.Module) -> nn.Module:
+        """INT8 copy of a network for CPU inference.
+        
+        Convolutional models are statically quantized when calibration inputs
+        are available, with Conv1d+ReLU and Linear+ReLU fused into single
+        kernels; otherwise Linear layers are dynamically quantized.
+        """
+        model.eval()
+        calibration = self._calibration.get(model_type)
+        if calibration is not None and any(isinstance(m, nn.Conv1d) for m in model.modules()):
+            fused = torch.ao.quantization.fuse_modules(model, self._fusable_pairs(model))
+            wrapped = nn.Sequential(
+                torch.ao.quantization.QuantStub(),
+                fused,
+                torch.ao.quantization.DeQuantStub()
+            ).eval()
+            wrapped.qconfig = torch.ao.quantization.get_default_qconfig(torch.backends.quantized.engine)
+            prepared = torch.ao.quantization.prepare(wrapped)
+            with torch.inference_mode():
+                prepared(calibration)
+            return torch.ao.quantization.convert(prepared)
+        return torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+
+    def _compile_forest_native(
+        self,
+        forest: RandomForestClassifier
+    ) -> Optional[Callable[[torch.Tensor], np.ndarray]]:
+        """Compile a fitted forest to a shared library of branchless C with treelite.
+        
+        The build directory is removed once the library is loaded. Returns None,
+        leaving ONNX or sklearn in use, if the optional dependencies are missing
+        or compilation fails.
+        """
+        if tl2cgen is None:
+            return None
+        build_dir = tempfile.mkdtemp(prefix='event_correlation_')
+        try:
+            libpath = os.path.join(build_dir, 'forest.so')
+            tl2cgen.export_lib(
+                treelite.sklearn.import_model(forest),
+                toolchain='gcc',
+                libpath=libpath,
+                params={'parallel_comp': 8}
+            )
+            predictor = tl2cgen.Predictor(libpath, nthread=1)
+        except Exception as e:
+            logger.warning(f"Native compilation of random forest failed: {str(e)}")
+            return None
+        finally:
+            # A loaded library stays mapped after its file is unlinked
+            shutil.rmtree(build_dir, ignore_errors=True)
+        classes = forest.classes_
+        
+        def predict(x: torch.Tensor) -> np.ndarray:
+            features = x.numpy().astype(np.float32, copy=False)
+            probabilities = predictor.predict(tl2cgen.DMatrix(features)).reshape(len(features), -1)
+            if probabilities.shape[1] == 1:
+                return classes[(probabilities[:, 0] > 0.5).astype(np.intp)]
+            return classes[probabilities.argmax(axis=1)]
+        return predict
+
+    def _compile_forest(
+        self,
+        forest: RandomForestClassifier
+    ) -> Optional[Callable[[np.ndarray], np.ndarray]]:
+        """Convert a fitted forest to ONNX and serve it with ONNX Runtime.
+        
+        Returns None, leaving sklearn's predict in use, if the optional
+        dependencies are missing or the conversion fails.
+        """
+        if onnxruntime is None:
+            return None
+        try:
+            onnx_model = convert_sklearn(
+                forest,
+                initial_types=[('X', FloatTensorType([None, forest.n_features_in_]))],
+                options={id(forest): {'zipmap': False}}
+            )
+            session = onnxruntime.InferenceSession(
+                onnx_model.SerializeToString(),
+                providers=['CPUExecutionProvider']
+            )
+        except Exception as e:
+            logger.warning(f"ONNX conversion of random forest failed, using sklearn: {str(e)}")
+            return None
+        
+        def predict(x: torch.Tensor) -> np.ndarray:
+            return session.run(None, {'X': x.numpy().astype(np.float32, copy=False)})[0]
+        return predict
+
+    def _create_model(self, model_type: str) -> Any:
+        """Create a fresh, untrained model of the given type."""
+        factories = {
+            'birth_time': self._create_birth_time_model,
+            'event_correlation': self._create_event_correlation_model,
+            'pattern_recognition': self._create_pattern_recognition_model
+        }
+        if model_type not in factories:
+            raise ValueError(f"Unknown model type: {model_type}")
+        return factories[model_type]()
+
+    def _store_weights(self, model: Any) -> str:
+        """Serialize a model's weights into the weight store and return their sha256 digest."""
+        buffer = io.BytesIO()
+        if isinstance(model, nn.Module):
+            torch.save(model.state_dict(), buffer)
+        else:
+            joblib.dump(model, buffer)
+        data = buffer.getvalue()
+        digest = hashlib.sha256(data).hexdigest()
+        self._weight_store.setdefault(digest, data)
+        return digest
+
+    def _snapshot_models(self) -> Dict[str, str]:
+        """Content digests of the current models, storing weights not seen before."""
+        return {
+            model_type: self._store_weights(model)
+            for model_type, model in self.models.items()
+        }
+
+    def _restore_models(self, snapshot: Dict[str, str]) -> Dict[str, Any]:
+        """Rebuild independent model instances from a version's weight digests."""
+        models = {}
+        for model_type, digest in snapshot.items():
+            data = io.BytesIO(self._weight_store[digest])
+            model = self._create_model(model_type)
+            if isinstance(model, nn.Module):
+                model.load_state_dict(torch.load(data, weights_only=True))
+                model.eval()
+            else:
+                model = joblib.load(data)
+            models[model_type] = model
+        return models
+
     def _prepare_birth_analysis_input(
         self,
         birth_data: Dict[str, Any],
@@ -316,11 +705,38 @@ class UnifiedMLEngine:
     def _preprocess_data(
         self,
         data: Dict[str, Any],
-        model_type: str
+        model_type: str,
+        features: Optional[np.ndarray] = None
     ) -> torch.Tensor:
-        """Preprocess input data based on model type."""
-        # Implement preprocessing logic
-        return torch.tensor([])
+        """Preprocess input data based on model type.
+        
+        The model reads a zero-copy view of the encoded feature vector; pass
+        features to share one encoding across models, else data is encoded here.
+        """
+        if features is None:
+            features = self._encode_features(data)
+        tensor = torch.from_numpy(features)
+        if model_type == 'pattern_recognition':
+            return tensor[_LONGITUDES].view(1, 1, -1)
+        return tensor.view(1, -1)
+
+    def _encode_features(self, data: Dict[str, Any]) -> np.ndarray:
+        """Encode an analysis input into the _FEATURE_SCHEMA vector."""
+        birth_data = data.get('birth_data') or {}
+        positions = data.get('planetary_positions') or {}
+        features = np.empty(len(_FEATURE_SCHEMA), dtype=np.float32)
+        for i, (source, field) in enumerate(_FEATURE_SCHEMA):
+            if source == 'birth_data':
+                value = birth_data.get(field)
+            else:
+                position = positions.get(source)
+                if isinstance(position, dict):
+                    value = position.get(field)
+                else:
+                    # Bare numbers are longitudes
+                    value = position if field == 'longitude' else None
+            features[i] = value if isinstance(value, (int, float)) else 0.0
+        return features
 
     def _calculate_prediction_confidence(
         self,
@@ -339,9 +755,18 @@ class UnifiedMLEngine:
         confidence: float,
         model_type: str
     ):
-        """Log prediction for learning and improvement."""
-        # Implement prediction logging logic
-        pass
+        """Record a prediction for learning and improvement; formatting and I/O happen off the hot path."""
+        if PREDICTION_LOG_PATH is None:
+            return
+        if _log_thread is None:
+            _start_prediction_log()
+        _PRED_LOG.append((time.monotonic_ns(), model_type, confidence))
+
+    def shutdown(self):
+        """Stop the prediction workers and flush buffered prediction records."""
+        self._pool.shutdown(wait=True)
+        if PREDICTION_LOG_PATH is not None:
+            _flush_prediction_log()
 
     def _train_model(
         self,
@@ -372,12 +797,13 @@ class UnifiedMLEngine:
         new_version = ModelVersion(
             version=f"1.0.{version_num}",
             timestamp=datetime.now(),
-            models=self.models.copy(),
+            models=self._snapshot_models(),
             metrics=metrics
         )
         
         self.version_history.append(new_version)
         self.current_version = new_version
+        self._scripted[new_version.version] = self._serialize_scripted()
 
     def _update_training_stats(
         self,
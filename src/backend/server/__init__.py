@@ -3,6 +3,13 @@ Birth Time Rectification Server
 Main server module for birth time rectification API.
 """
 
+# Prefer uvloop's faster event loop for the async service integrations
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from .app import app
 
 __all__ = ['app']